@@ -27,43 +27,374 @@ SOFTWARE.
 
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, Gdk
+from gi.repository import Gtk, GLib, Gdk, Gio
+import cairo
 import subprocess
 import threading
+import queue
 import os
 import shutil
 import platform
 import json
+import re
 import tempfile
 import time
+import functools
+import hmac
+import concurrent.futures
 from collections import deque
 
-# Check if keyring module is available
+# Check if keyring module is available; its backend is picked by init_keyring()
 try:
     import keyring
-    # Try to detect and avoid KDE Wallet if it's causing issues
-    backend = keyring.get_keyring()
-    backend_name = backend.__class__.__name__.lower()
-    
-    # If KDE Wallet is detected and we're not on KDE, try to use Secret Service
-    if 'kde' in backend_name or 'kwallet' in backend_name:
-        try:
-            # Try to force SecretService backend for GNOME/XFCE
-            from keyring.backends import SecretService
-            keyring.set_keyring(SecretService.Keyring())
-            KEYRING_AVAILABLE = True
-        except:
-            # If we can't set SecretService, disable keyring to avoid KDE Wallet popups
-            KEYRING_AVAILABLE = False
-            print("KDE Wallet detected but not available. Using file storage instead.")
-    else:
-        KEYRING_AVAILABLE = True
+    KEYRING_AVAILABLE = True
 except ImportError:
     KEYRING_AVAILABLE = False
-except Exception:
-    # Any other keyring initialization error - disable it
-    KEYRING_AVAILABLE = False
-    print("Keyring initialization failed. Using file storage instead.")
+
+@functools.lru_cache(maxsize=1)
+def init_keyring():
+    """Set up the keyring backend on first use and return KEYRING_AVAILABLE
+    
+    Looking up the backend can probe D-Bus for a while, so it is not done at import.
+    """
+    global KEYRING_AVAILABLE
+    if not KEYRING_AVAILABLE:
+        return False
+    try:
+        # Try to detect and avoid KDE Wallet if it's causing issues
+        backend = keyring.get_keyring()
+        backend_name = backend.__class__.__name__.lower()
+        
+        # If KDE Wallet is detected and we're not on KDE, try to use Secret Service
+        if 'kde' in backend_name or 'kwallet' in backend_name:
+            try:
+                # Try to force SecretService backend for GNOME/XFCE
+                from keyring.backends import SecretService
+                keyring.set_keyring(SecretService.Keyring())
+            except:
+                # If we can't set SecretService, disable keyring to avoid KDE Wallet popups
+                KEYRING_AVAILABLE = False
+                print("KDE Wallet detected but not available. Using file storage instead.")
+    except Exception:
+        # Any other keyring initialization error - disable it
+        KEYRING_AVAILABLE = False
+        print("Keyring initialization failed. Using file storage instead.")
+    return KEYRING_AVAILABLE
+
+# Use orjson for the credentials store (keyring payload and file) when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(data):
+    """Parse JSON from str or bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def json_dumps(obj):
+    """Serialize obj to JSON as UTF-8 bytes"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode()
+
+# OpenVPN3 StatusChange codes (StatusMajor / StatusMinor in openvpn3-linux)
+STATUS_MAJOR_CONNECTION = 2
+STATUS_MINOR_CONN_CONNECTED = 7
+STATUS_MINOR_CONN_DISCONNECTED = 9
+STATUS_MINOR_CONN_FAILED = 10
+STATUS_MINOR_CONN_AUTH_FAILED = 11
+STATUS_MINOR_CONN_DONE = 16
+
+# OpenVPN3 D-Bus services (each service uses its name as interface name)
+OVPN3_CONFIG_SERVICE = "net.openvpn.v3.configuration"
+OVPN3_CONFIG_PATH = "/net/openvpn/v3/configuration"
+OVPN3_SESSIONS_SERVICE = "net.openvpn.v3.sessions"
+OVPN3_SESSIONS_PATH = "/net/openvpn/v3/sessions"
+
+# KEY=value or KEY="value" lines of /etc/os-release
+OS_RELEASE_RE = re.compile(r'^([A-Z_]+)=(?:"([^"]*)"|(\S*))', re.M)
+
+# Linux Mint major version -> Ubuntu base codename
+MINT_UBUNTU_BASES = {'22': 'noble', '21': 'jammy', '20': 'focal'}
+
+# Fixed text around the generated commands in the install dialog
+INSTALL_DIALOG_HEADER = (
+    "Installation Instructions:\n\n"
+    "The following commands will be executed to install OpenVPN3:\n\n"
+)
+INSTALL_DIALOG_FOOTER = (
+    "\n\n"
+    "Click 'Install Automatically' to run these commands (requires sudo password)\n"
+    "Click 'Copy Commands' to copy them to clipboard for manual execution\n"
+)
+
+# OpenVPN3 install script; get_install_commands fills in {arch} and {dist_codename}
+INSTALL_COMMANDS_TEMPLATE = """# Install prerequisites
+sudo apt update
+sudo apt install -y apt-transport-https curl gpg
+
+# Create keyrings directory if it doesn't exist (for newer apt versions)
+sudo mkdir -p /etc/apt/keyrings
+
+# Add OpenVPN repository key
+# Download and save the GPG key directly (without dearmor for ASCII-armored keys)
+curl -fsSL https://packages.openvpn.net/packages-repo.gpg | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
+
+# Verify the key was added successfully
+if [ ! -f /etc/apt/keyrings/openvpn.asc ]; then
+    echo "Error: Failed to download GPG key. Trying alternative method..."
+    # Alternative: Try with wget if curl fails
+    wget -qO- https://packages.openvpn.net/packages-repo.gpg | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
+fi
+
+# Add OpenVPN3 repository
+echo "deb [arch={arch} signed-by=/etc/apt/keyrings/openvpn.asc] https://packages.openvpn.net/openvpn3/debian {dist_codename} main" | sudo tee /etc/apt/sources.list.d/openvpn3.list
+
+# Update package lists
+echo ""
+echo "Updating package lists..."
+sudo apt update
+
+# Check if update succeeded (no GPG errors)
+if sudo apt update 2>&1 | grep -q "NO_PUBKEY"; then
+    echo ""
+    echo "Warning: GPG key verification issue detected."
+    echo "Attempting to fix by re-downloading the key..."
+    
+    # Try alternative key URL
+    curl -fsSL https://swupdate.openvpn.net/repos/openvpn-repo-pkg-key.pub | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
+    
+    # Update again
+    sudo apt update
+fi
+
+# Install OpenVPN3
+echo ""
+echo "Installing OpenVPN3..."
+sudo apt install -y openvpn3
+
+# Optional: Install Python keyring for secure credential storage
+echo ""
+echo "Installing Python keyring for secure credential storage..."
+echo "Using apt method (recommended for Linux Mint 22 / Ubuntu 24.04+)..."
+sudo apt install -y python3-keyring python3-secretstorage gnome-keyring
+
+echo ""
+echo "✓ Keyring support packages installed"
+"""
+
+# Keyring installation options shown in the Install Keyring Support dialog
+KEYRING_INSTALL_OPTIONS = """Installation Options for Linux Mint 22 / Ubuntu 24.04+:
+
+1. Using apt (RECOMMENDED - System Package Manager):
+   sudo apt update
+   sudo apt install python3-keyring python3-secretstorage gnome-keyring
+
+2. Using pipx (For User Installation - Isolated Environment):
+   # First install pipx if not already installed:
+   sudo apt install pipx
+   pipx ensurepath
+   
+   # Then install keyring:
+   pipx install keyring
+
+3. Using pip with --break-system-packages (NOT RECOMMENDED):
+   pip install --user --break-system-packages keyring
+   
+   ⚠️ Warning: This bypasses system protections and may cause issues
+
+4. Using a Virtual Environment (For Development):
+   python3 -m venv ~/vpn3gui-venv
+   source ~/vpn3gui-venv/bin/activate
+   pip install keyring
+   # Note: You'll need to run the GUI from this venv
+
+After installation, restart this application to enable secure credential storage.
+
+Note: Modern Linux distributions (Mint 22+, Ubuntu 23.04+, Debian 12+) use PEP 668
+to protect system Python packages. The apt method is preferred for system-wide use.
+"""
+
+# Beginner steps shown when the keyring is locked or missing
+SIMPLE_KEYRING_FIX_TEXT = """Your VPN passwords need a secure place to be stored.
+
+QUICK FIX - Takes 30 seconds:
+━━━━━━━━━━━━━━━━━━━━━━━━
+1. Click your Menu button (bottom left)
+2. Type: passwords
+3. Open "Passwords and Keys"
+4. Right-click on "Login"
+5. Choose "Unlock"
+6. Enter your computer password
+7. Close and restart this VPN app
+
+That's it! Your passwords will now be stored securely.
+
+If you need more help: Tools → Fix Password Storage Issues
+
+(For now, passwords will be saved locally until you complete this step)"""
+
+# Full keyring troubleshooting steps (Tools → Fix Password Storage Issues)
+KEYRING_INIT_HELP_TEXT = """Your keyring needs to be unlocked to store VPN passwords securely.
+
+SIMPLE FIX (Try this first):
+━━━━━━━━━━━━━━━━━━━━━━
+1. Click on your Menu button (bottom left corner)
+2. Type "passwords" in the search box
+3. Open "Passwords and Keys" app
+4. Look for a keyring called "Login" (you probably have this)
+5. If you see a locked padlock icon next to "Login":
+   • Right-click on "Login"
+   • Choose "Unlock"
+   • Enter YOUR COMPUTER LOGIN PASSWORD
+   • The padlock should now appear open
+
+If there's NO "Login" keyring:
+━━━━━━━━━━━━━━━━━━━━━━
+1. In "Passwords and Keys" app
+2. Click the "+" button (top left corner)
+3. Select "Password Keyring"
+4. Name it exactly: Login
+5. Password: Use YOUR COMPUTER LOGIN PASSWORD
+6. Confirm the password
+
+Still Having Issues?
+━━━━━━━━━━━━━━━━
+Try the automatic fix:
+1. Close this VPN app
+2. Open Terminal (Ctrl+Alt+T)
+3. Type: echo "" | gnome-keyring-daemon --unlock
+4. Press Enter (this unlocks with empty password)
+5. Restart the VPN app
+
+IMPORTANT: Your keyring password is the SAME password you use to log into Linux Mint.
+
+Note: Until fixed, your VPN passwords will be saved in a local file instead of the keyring."""
+
+# Scripts run in a terminal (via bash -c) by Tools → Install Keyring Support
+KEYRING_INSTALL_SCRIPT_APT = """#!/bin/bash
+echo "Installing Python keyring module via apt (Recommended)..."
+echo ""
+echo "This will install:"
+echo "  • python3-keyring - Python keyring library"
+echo "  • python3-secretstorage - Python Secret Service API"
+echo "  • gnome-keyring - GNOME keyring service"
+echo ""
+sudo apt update
+sudo apt install -y python3-keyring python3-secretstorage gnome-keyring
+if [ $? -eq 0 ]; then
+    echo ""
+    echo "✓ Keyring installed successfully!"
+    echo ""
+    echo "The system keyring service is now available for secure credential storage."
+    echo "Please restart the VPN GUI to enable this feature."
+else
+    echo ""
+    echo "✗ Installation failed."
+    echo "Please check your internet connection and try again."
+fi
+echo ""
+echo "Press Enter to close..."
+read
+"""
+
+KEYRING_INSTALL_SCRIPT_PIPX = """#!/bin/bash
+echo "Installing Python keyring module via pipx..."
+echo ""
+echo "Step 1: Checking for pipx..."
+if ! command -v pipx &> /dev/null; then
+    echo "pipx not found. Installing pipx first..."
+    sudo apt update
+    sudo apt install -y pipx
+    if [ $? -ne 0 ]; then
+        echo "✗ Failed to install pipx"
+        echo "Press Enter to close..."
+        read
+        exit 1
+    fi
+    echo "✓ pipx installed"
+    echo ""
+    echo "Setting up pipx path..."
+    pipx ensurepath
+    export PATH="$PATH:$HOME/.local/bin"
+fi
+
+echo "Step 2: Installing keyring with pipx..."
+pipx install keyring
+if [ $? -eq 0 ]; then
+    echo ""
+    echo "✓ Keyring installed successfully via pipx!"
+    echo ""
+    echo "Note: You may need to log out and back in for PATH changes to take effect."
+    echo "Or run: source ~/.bashrc"
+    echo ""
+    echo "Please restart the VPN GUI to use secure credential storage."
+else
+    echo ""
+    echo "✗ Installation failed."
+    echo "You may want to try the apt method instead."
+fi
+echo ""
+echo "Press Enter to close..."
+read
+"""
+
+# Terminal emulators to run install scripts in, in order of preference
+# and the arguments after which each takes the command line to run
+TERMINAL_COMMANDS = (
+    ("gnome-terminal", ["gnome-terminal", "--"]),
+    ("xfce4-terminal", ["xfce4-terminal", "-x"]),
+    ("mate-terminal", ["mate-terminal", "-x"]),
+    ("konsole", ["konsole", "-e"]),
+    ("xterm", ["xterm", "-e"]),
+)
+
+# First column of each configs-list row (separator rows start with '-')
+CONFIG_LINE_RE = re.compile(r'^(?!-)[ \t]*(\S+)', re.M)
+
+# Deadlines (seconds) per openvpn3 subcommand; anything else gets DEFAULT_COMMAND_TIMEOUT.
+# Listing is quick, while session-start waits for the server to authenticate us.
+COMMAND_TIMEOUTS = {
+    'configs-list': 5,
+    'sessions-list': 5,
+    'session-stats': 5,
+    'config-dump': 5,
+    'config-import': 15,
+    'session-manage': 15,
+    'session-start': 60,
+}
+DEFAULT_COMMAND_TIMEOUT = 10
+
+def command_timeout(cmd):
+    """Return the deadline in seconds for an openvpn3 command line"""
+    return COMMAND_TIMEOUTS.get(cmd[1] if len(cmd) > 1 else None, DEFAULT_COMMAND_TIMEOUT)
+
+# Session object path anywhere in openvpn3 output (e.g. "Path: /net/openvpn/v3/sessions/...")
+SESSION_PATH_RE = re.compile(r'(/net/openvpn/v3/sessions/\S+)')
+
+def find_session_path(line):
+    """Return the first session object path mentioned in openvpn3 output, if any"""
+    match = SESSION_PATH_RE.search(line)
+    return match.group(1) if match else None
+
+# Minimum time between traffic chart redraws (caps redraws at 10 per second)
+CHART_REDRAW_INTERVAL_MS = 100
+
+# BYTES_IN/BYTES_OUT rows of session-stats, e.g. "     BYTES_IN....................9438"
+# (TUN_BYTES_IN and friends do not match because of the leading-whitespace anchor)
+STATS_RE = re.compile(r'^[ \t]*(BYTES_IN|BYTES_OUT)\.+(\d+)[ \t]*$', re.M)
+
+# auth-user-pass directive in a config dump, with its optional credentials file
+# (anything after the file is ignored; auth-user-pass-verify does not match)
+AUTH_USER_PASS_RE = re.compile(r'^[ \t]*auth-user-pass(?!\S)(?:[ \t]+(\S+))?', re.M)
+
+# Home directory with a trailing slash, looked up once
+HOME_PREFIX = os.path.expanduser("~/")
+
+def expand_home(path):
+    """os.path.expanduser() without re-reading $HOME for the usual '~/...' form"""
+    if path.startswith("~/"):
+        return HOME_PREFIX + path[2:]
+    return os.path.expanduser(path) if path.startswith("~") else path
 
 class VPNManager(Gtk.Window):
     def __init__(self):
@@ -97,7 +428,11 @@ class VPNManager(Gtk.Window):
         
         config_label = Gtk.Label(label="Select Config:")
         config_hbox.pack_start(config_label, False, False, 0)
-        self.config_combo = Gtk.ComboBoxText()
+        # Plain ComboBox over our own ListStore so refreshes can swap the whole model
+        self.config_combo = Gtk.ComboBox.new_with_model(Gtk.ListStore(str))
+        config_renderer = Gtk.CellRendererText()
+        self.config_combo.pack_start(config_renderer, True)
+        self.config_combo.add_attribute(config_renderer, "text", 0)
         config_hbox.pack_start(self.config_combo, True, True, 0)
         
         # Refresh configs button
@@ -128,6 +463,7 @@ class VPNManager(Gtk.Window):
         self.stop_button.connect("clicked", self.stop_vpn)
         self.stop_button.set_sensitive(False)
         button_box.pack_start(self.stop_button, True, True, 0)
+        self._connected = False  # Button state last applied by _set_connected
         
         # Status frame
         status_frame = Gtk.Frame(label="Status")
@@ -148,6 +484,9 @@ class VPNManager(Gtk.Window):
         scrolled_window.add(self.status_view)
         
         self.status_buffer = self.status_view.get_buffer()
+        self._pending_status = None  # Latest text waiting for the idle flush
+        self._status_idle_id = 0
+        self._last_status_text = None  # What the buffer currently shows
         
         # Tab 2: Traffic chart
         chart_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
@@ -186,7 +525,8 @@ class VPNManager(Gtk.Window):
         
         # Add tabs to notebook
         self.status_notebook.append_page(scrolled_window, Gtk.Label(label="Status"))
-        self.status_notebook.append_page(chart_container, Gtk.Label(label="Traffic Chart"))
+        self.chart_page = self.status_notebook.append_page(chart_container, Gtk.Label(label="Traffic Chart"))
+        self.status_notebook.connect("switch-page", self.on_status_page_switched)
         
         # Show all widgets in chart container
         chart_container.show_all()
@@ -198,6 +538,14 @@ class VPNManager(Gtk.Window):
         self.last_bytes_in = 0
         self.last_bytes_out = 0
         self.chart_max_value = 1000  # Initial max value for Y-axis
+        self.chart_peak_rate = 0  # Largest rate currently in either history
+        self._chart_redraw_id = 0  # Pending throttled redraw, if any
+        self._grid_cache = None  # Recorded background/grid/axes for _grid_cache_size
+        self._grid_cache_size = (0, 0)
+        self._chart_surface = None  # Off-screen copy of the rendered chart
+        self._chart_surface_size = (0, 0)
+        self._chart_xs = []  # X coordinate of each data point for _chart_xs_width
+        self._chart_xs_width = -1
         
         # Add a toolbar for better visibility (matching rdp2gui style)
         toolbar = Gtk.Toolbar()
@@ -308,72 +656,384 @@ class VPNManager(Gtk.Window):
         
         # Credential storage - must be initialized before load_credentials()
         self.credentials_file = os.path.expanduser("~/.config/vpn3gui/credentials.json")
-        self.temp_auth_files = []  # Track temporary auth files for cleanup
         self.plaintext_configs = []  # Track configs with plaintext auth
+        self._plaintext_summary = ""  # Bullet list of plaintext_configs for dialogs
         self.use_keyring = KEYRING_AVAILABLE  # Track whether to use keyring
+        self._keyring_pending = False  # Last keyring write failed; credentials only in the file
         
-        # Load stored credentials after initializing paths
-        self.stored_credentials = self.load_credentials()
+        # Load stored credentials once the window is up - the keyring may be slow
+        self.stored_credentials = {}
+        GLib.idle_add(self.load_stored_credentials)
         
         # Initialize connection state tracking
         self.is_connecting = False
+        self._connect_proc = None  # session-start Gio.Subprocess while connecting
+        self._connect_cancelled = False
         self.debug_mode = False  # Set to True to see command output
         
+        # Short-lived cache of command results: tuple(cmd) -> (timestamp, CompletedProcess)
+        self._cmd_cache = {}
+        self._which_cache = {}  # Program name -> resolved path (or None)
+        self._config_dump_cache = {}  # Config path -> config-dump output (None if it failed)
+        
+        # One long-lived worker thread for blocking jobs that must stay off the UI thread
+        self._job_queue = queue.Queue()
+        self._job_worker = threading.Thread(target=self._job_loop, daemon=True)
+        self._job_worker.start()
+        self._install_commands = None  # Built on first use by install_commands
+        self._install_script_path = None  # Private temp file holding the install script
+        self._install_script_commands = None  # Commands last written to it
+        self._terminal_argv = None  # Argument prefix of the TERMINAL_COMMANDS entry found here
+        self._cred_dialog = None  # Credentials dialog, built on first use
+        self._message_dialogs = {}  # (message type, buttons) -> reusable MessageDialog
+        self._clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)  # For "Copy Commands"
+        
+        # Listen for session status changes instead of polling sessions-list
+        self._bus = None
+        self._status_sub_id = 0
+        try:
+            self._bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+            self._status_sub_id = self._bus.signal_subscribe(
+                None,
+                OVPN3_SESSIONS_SERVICE,
+                "StatusChange",
+                None,
+                None,
+                Gio.DBusSignalFlags.NONE,
+                self._on_status_change
+            )
+        except GLib.Error as e:
+            # No system bus - fall back to polling sessions-list. The openvpn3
+            # command talks to the same D-Bus services, so a long-running CLI
+            # monitor would not work here either; short polls are the fallback.
+            self._bus = None
+            print(f"D-Bus unavailable, polling for status instead: {e.message}")
+        
+        # Periodic status polling; paused while the window is minimized
+        self._status_timeout_id = 0
+        self.connect("window-state-event", self._on_window_state)
+        
         # Check if openvpn3 is installed
         if not self.check_openvpn3_installed():
             GLib.idle_add(self.show_install_prompt)
         else:
             self.refresh_configs()
             # Start periodic status updates (but don't run immediately)
-            GLib.timeout_add_seconds(2, self.update_status)  # Update every 2 seconds for smoother chart
+            self._status_timeout_id = GLib.timeout_add_seconds(2, self.poll_status)  # Update every 2 seconds for smoother chart
+            if self._bus is not None:
+                # Later changes arrive as D-Bus signals; take one initial snapshot
+                GLib.timeout_add_seconds(2, self.update_status)
             # Check for plaintext credentials after loading configs
             GLib.timeout_add_seconds(2, self.check_for_plaintext_auth)
         
-    def run_command(self, cmd, callback=None):
-        """Run command in background thread"""
+    def run_command(self, cmd, callback=None, cache_ttl=None, timeout=None, capture=True,
+                    input=None, on_error=None):
+        """Run command asynchronously; callback gets a CompletedProcess on the main loop
+        
+        If cache_ttl (seconds) is given, a successful result of the same command
+        obtained within the last cache_ttl seconds is reused instead of spawning.
+        The command is killed after timeout seconds (default: command_timeout(cmd)).
+        With capture=False stdout is discarded and result.stdout is empty.
+        input (str) is written to the command's stdin. If the command cannot be
+        run or times out, on_error(message) is called instead of showing an
+        error dialog. Returns the Gio.Subprocess, or None if nothing was spawned.
+        """
+        if on_error is None:
+            on_error = self.show_error
+        key = tuple(cmd)
+        if cache_ttl is not None:
+            cached = self._cmd_cache.get(key)
+            if cached and time.monotonic() - cached[0] < cache_ttl:
+                if self.debug_mode:
+                    print(f"Using cached result: {' '.join(cmd)}")
+                GLib.idle_add(callback, cached[1]) if callback else None
+                return None
+        
         if self.debug_mode:
             print(f"Running command: {' '.join(cmd)}")
         
-        def run():
+        try:
+            # The GLib main loop waits for the child, so no helper thread is needed
+            flags = Gio.SubprocessFlags.STDOUT_PIPE if capture else Gio.SubprocessFlags.STDOUT_SILENCE
+            if input is not None:
+                flags |= Gio.SubprocessFlags.STDIN_PIPE
+            proc = Gio.Subprocess.new(cmd, flags | Gio.SubprocessFlags.STDERR_PIPE)
+        except GLib.Error as e:
+            on_error(e.message)
+            return None
+        
+        timed_out = False
+        if timeout is None:
+            timeout = command_timeout(cmd)
+        
+        def on_timeout():
+            nonlocal timed_out, timeout_id
+            timed_out = True
+            timeout_id = 0
+            proc.force_exit()
+            return False
+        
+        timeout_id = GLib.timeout_add_seconds(timeout, on_timeout)
+        
+        def done(proc, res):
+            if timeout_id:
+                GLib.source_remove(timeout_id)
+            try:
+                _, stdout, stderr = proc.communicate_utf8_finish(res)
+            except GLib.Error as e:
+                on_error(e.message)
+                return
+            if timed_out:
+                on_error(f"Command timed out after {timeout} seconds: {' '.join(cmd)}")
+                return
+            
+            returncode = proc.get_exit_status() if proc.get_if_exited() else -proc.get_term_sig()
+            result = subprocess.CompletedProcess(
+                args=cmd,
+                returncode=returncode,
+                stdout=stdout or "",
+                stderr=stderr or ""
+            )
+            if self.debug_mode and result.stdout:
+                print(f"Command output: {result.stdout[:500]}")
+            if self.debug_mode and result.stderr:
+                print(f"Command error: {result.stderr[:500]}")
+            if cache_ttl is not None and result.returncode == 0:
+                self._cmd_cache[key] = (time.monotonic(), result)
+            if callback:
+                callback(result)
+        
+        proc.communicate_utf8_async(input, None, done)
+        return proc
+    
+    def _job_loop(self):
+        """Run queued background jobs one at a time (worker thread)"""
+        while True:
+            func, args = self._job_queue.get()
             try:
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                if self.debug_mode and result.stdout:
-                    print(f"Command output: {result.stdout[:500]}")
-                if self.debug_mode and result.stderr:
-                    print(f"Command error: {result.stderr[:500]}")
-                GLib.idle_add(callback, result) if callback else None
-            except subprocess.TimeoutExpired:
-                GLib.idle_add(self.show_error, "Command timed out")
+                func(*args)
             except Exception as e:
                 GLib.idle_add(self.show_error, str(e))
+    
+    def run_in_background(self, func, *args):
+        """Queue func(*args) for the background worker thread"""
+        self._job_queue.put((func, args))
+    
+    def stream_command(self, cmd, on_line, on_done=None, timeout=None):
+        """Run command and hand its stdout to on_line() one line at a time
+        
+        If on_line(line) returns True the command is killed without reading
+        the rest. on_done(returncode) runs once at the end; returncode is None
+        when stopped early. The command is killed after timeout seconds
+        (default: command_timeout(cmd)).
+        """
+        if self.debug_mode:
+            print(f"Streaming command: {' '.join(cmd)}")
+        
+        try:
+            proc = Gio.Subprocess.new(cmd, Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE)
+        except GLib.Error as e:
+            self.show_error(e.message)
+            return
+        
+        stream = Gio.DataInputStream.new(proc.get_stdout_pipe())
+        
+        def on_timeout():
+            nonlocal timeout_id
+            timeout_id = 0
+            proc.force_exit()  # Closes stdout, so the next read sees EOF
+            return False
+        
+        timeout_id = GLib.timeout_add_seconds(timeout or command_timeout(cmd), on_timeout)
+        
+        def finish(returncode):
+            if timeout_id:
+                GLib.source_remove(timeout_id)
+            if on_done:
+                on_done(returncode)
+        
+        def exited(proc, res):
+            try:
+                proc.wait_finish(res)
+            except GLib.Error:
+                pass
+            finish(proc.get_exit_status() if proc.get_if_exited() else -proc.get_term_sig())
+        
+        def got_line(stream, res):
+            try:
+                line, _ = stream.read_line_finish_utf8(res)
+            except GLib.Error:
+                line = None
+            if line is None:
+                # End of output - collect the exit status
+                proc.wait_async(None, exited)
+                return
+            if self.debug_mode:
+                print(f"Command output: {line[:500]}")
+            if on_line(line):
+                proc.force_exit()
+                finish(None)
+                return
+            stream.read_line_async(GLib.PRIORITY_DEFAULT, None, got_line)
+        
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, None, got_line)
+    
+    def invalidate_command_cache(self, *cmds):
+        """Drop cached results so the next run of these commands spawns again"""
+        for cmd in cmds:
+            self._cmd_cache.pop(tuple(cmd), None)
+    
+    def dbus_call(self, service, object_path, interface, method, params=None, reply_type=None, callback=None):
+        """Call a D-Bus method asynchronously on the system bus
+        
+        callback(reply, error) runs on the main loop with the unpacked reply
+        tuple, or with reply=None and the error message if the call failed.
+        """
+        if self.debug_mode:
+            print(f"D-Bus call: {object_path} {interface}.{method}")
         
-        thread = threading.Thread(target=run)
-        thread.daemon = True
-        thread.start()
+        def done(bus, res):
+            try:
+                reply = bus.call_finish(res).unpack()
+            except GLib.Error as e:
+                if self.debug_mode:
+                    print(f"D-Bus error: {e.message}")
+                if callback:
+                    callback(None, e.message)
+                return
+            if callback:
+                callback(reply, None)
+        
+        self._bus.call(
+            service, object_path, interface, method, params,
+            GLib.VariantType.new(reply_type) if reply_type else None,
+            Gio.DBusCallFlags.NONE, -1, None, done
+        )
+    
+    def dbus_get_property(self, service, object_path, interface, name, callback):
+        """Read a D-Bus property asynchronously; callback(value, error)"""
+        self.dbus_call(
+            service, object_path, "org.freedesktop.DBus.Properties", "Get",
+            GLib.Variant("(ss)", (interface, name)), "(v)",
+            lambda reply, error: callback(reply[0] if reply else None, error)
+        )
+    
+    def fetch_config_names(self, callback):
+        """Look up the names of all imported configs over D-Bus; callback(names or None)"""
+        def got_paths(reply, error):
+            if error is not None:
+                callback(None)
+                return
+            paths = reply[0]
+            if not paths:
+                callback([])
+                return
+            
+            names = [None] * len(paths)
+            remaining = len(paths)
+            
+            def got_name(value, error, index):
+                nonlocal remaining
+                names[index] = value
+                remaining -= 1
+                if remaining == 0:
+                    callback([name for name in names if name])
+            
+            for index, path in enumerate(paths):
+                self.dbus_get_property(
+                    OVPN3_CONFIG_SERVICE, path, OVPN3_CONFIG_SERVICE, "name",
+                    lambda value, error, index=index: got_name(value, error, index)
+                )
+        
+        self.dbus_call(OVPN3_CONFIG_SERVICE, OVPN3_CONFIG_PATH, OVPN3_CONFIG_SERVICE,
+                       "FetchAvailableConfigs", None, "(ao)", got_paths)
+    
+    def fetch_sessions(self, callback, cache_ttl=None, first_only=False):
+        """List session object paths; callback(paths), or callback(None) if listing failed
+        
+        With first_only, the CLI listing stops at the first session found.
+        """
+        if self._bus is not None:
+            self.dbus_call(
+                OVPN3_SESSIONS_SERVICE, OVPN3_SESSIONS_PATH, OVPN3_SESSIONS_SERVICE,
+                "FetchAvailableSessions", None, "(ao)",
+                lambda reply, error: callback(list(reply[0]) if reply else None)
+            )
+            return
+        
+        if first_only:
+            found = []
+            
+            def on_line(line):
+                session_path = find_session_path(line)
+                if session_path:
+                    found.append(session_path)
+                    return True  # No need to read further
+                return False
+            
+            self.stream_command(
+                ["openvpn3", "sessions-list"], on_line,
+                lambda returncode: callback(found if found or returncode == 0 else None)
+            )
+            return
+        
+        def parse_sessions(result):
+            if result.returncode != 0:
+                callback(None)
+                return
+            # One scan over the whole output instead of a per-line loop;
+            # dict.fromkeys drops repeats but keeps the listing order
+            callback(list(dict.fromkeys(SESSION_PATH_RE.findall(result.stdout))))
+        
+        self.run_command(["openvpn3", "sessions-list"], parse_sessions, cache_ttl=cache_ttl)
         
     def refresh_configs(self, widget=None):
         """Refresh the list of available configs"""
+        if widget is not None:
+            # Explicit Refresh click - always ask openvpn3 again
+            self.invalidate_command_cache(["openvpn3", "configs-list"])
+            self._config_dump_cache.clear()
+        
+        if self._bus is not None:
+            self.fetch_config_names(self.set_config_list)
+            return
+        
         def update_combo(result):
-            self.config_combo.remove_all()
-            self.config_paths = {}  # Store mapping of display names to paths
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines[2:]:  # Skip header lines
-                    if line.strip() and not line.startswith('-'):
-                        # First column is the config path
-                        parts = line.split()
-                        if len(parts) >= 1:
-                            config_path = parts[0]
-                            # Use just the filename for display
-                            display_name = os.path.basename(config_path)
-                            self.config_combo.append_text(display_name)
-                            self.config_paths[display_name] = config_path
-                if self.config_combo.get_model().iter_n_children(None) > 0:
-                    self.config_combo.set_active(0)
-            else:
-                self.config_combo.append_text("No configs available")
+            if result.returncode != 0:
+                self.set_config_list(None)
+                return
+            # Skip the two header lines, then take the first column of each row
+            # straight from the output without splitting it into lines
+            body = result.stdout.split('\n', 2)[2:]
+            self.set_config_list(CONFIG_LINE_RE.findall(body[0]) if body else [])
                 
-        self.run_command(["openvpn3", "configs-list"], update_combo)
+        self.run_command(["openvpn3", "configs-list"], update_combo, cache_ttl=30)
+    
+    def set_config_list(self, config_paths):
+        """Fill the config dropdown; None means the list could not be fetched"""
+        if config_paths is None:
+            new_paths = {}
+        else:
+            # Map display names (just the filename) to paths
+            new_paths = {config_path.rpartition('/')[2]: config_path for config_path in config_paths}
+            if new_paths and new_paths == self.config_paths:
+                return  # Same configs - leave the dropdown and selection alone
+        
+        previous = self.get_selected_config()
+        self.config_paths = new_paths
+        
+        # Build the rows off-screen and swap the model in once, instead of
+        # emitting a row-deleted/row-inserted signal per entry
+        store = Gtk.ListStore(str)
+        if config_paths is None:
+            store.append(["No configs available"])
+        for display_name in new_paths:
+            store.append([display_name])
+        self.config_combo.set_model(store)
+        if new_paths:
+            # Keep the user's choice when it is still there
+            names = list(new_paths)
+            self.config_combo.set_active(names.index(previous) if previous in new_paths else 0)
         
     def import_config(self, widget):
         """Import a new config file"""
@@ -404,9 +1064,11 @@ class VPNManager(Gtk.Window):
             dialog.destroy()
             
             def import_done(result):
+                self.invalidate_command_cache(["openvpn3", "configs-list"])
+                self._config_dump_cache.clear()  # A re-import may replace a config's content
                 if result.returncode == 0:
                     self.update_status_text("Config imported successfully!")
-                    self.refresh_configs()
+                    self.add_imported_config(filepath, result.stdout)
                 else:
                     self.show_error(f"Import failed: {result.stderr}")
                     
@@ -414,9 +1076,33 @@ class VPNManager(Gtk.Window):
         else:
             dialog.destroy()
             
+    def get_selected_config(self):
+        """Display name of the selected config, or None"""
+        tree_iter = self.config_combo.get_active_iter()
+        if tree_iter is None:
+            return None
+        return self.config_combo.get_model()[tree_iter][0]
+    
+    def add_imported_config(self, filepath, output):
+        """Add a freshly imported config to the dropdown without re-listing all configs"""
+        _, found, _ = output.partition("Configuration path:")
+        if not found:
+            # Unexpected output - ask openvpn3 for the full list instead
+            self.refresh_configs()
+            return
+        
+        # openvpn3 names the config after the file unless told otherwise
+        _, found, name = output.partition("Configuration name:")
+        config_name = name.split('\n', 1)[0].strip() if found else filepath
+        display_name = config_name.rpartition('/')[2]  # Same as set_config_list
+        
+        if display_name not in self.config_paths:
+            self.set_config_list(list(self.config_paths.values()) + [config_name])
+        self.config_combo.set_active(list(self.config_paths).index(display_name))
+        
     def start_vpn(self, widget):
         """Start VPN connection"""
-        display_name = self.config_combo.get_active_text()
+        display_name = self.get_selected_config()
         if not display_name or display_name == "No configs available":
             self.show_error("Please select a valid configuration")
             return
@@ -436,142 +1122,197 @@ class VPNManager(Gtk.Window):
         
     def stop_vpn(self, widget):
         """Stop VPN connection"""
-        if not self.current_session:
+        if self.is_connecting:
+            self.cancel_connect()
+        elif not self.current_session:
             # Try to find active session
-            self.run_command(["openvpn3", "sessions-list"], self.find_and_disconnect)
+            self.fetch_sessions(self.find_and_disconnect, first_only=True)
         else:
             self.disconnect_session(self.current_session)
             
-    def find_and_disconnect(self, result):
+    def cancel_connect(self):
+        """Abort a session-start that is still waiting for the server"""
+        self._connect_cancelled = True
+        if self._connect_proc is not None:
+            self._connect_proc.force_exit()  # start_done then sees the cancellation
+        self.update_status_text("Cancelling connection...")
+    
+    def find_and_disconnect(self, session_paths):
         """Find active session and disconnect"""
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if '/net/openvpn/v3/sessions/' in line:
-                    session_path = line.split()[0]
-                    self.disconnect_session(session_path)
-                    return
+        if session_paths:
+            self.disconnect_session(session_paths[0])
         
     def disconnect_session(self, session_path):
         """Disconnect specific session"""
         self.update_status_text("Disconnecting...")
         
-        def disconnect_done(result):
-            if result.returncode == 0:
+        def disconnect_done(error):
+            self.invalidate_command_cache(["openvpn3", "sessions-list"])
+            if error is None:
                 self.current_session = None
-                self.start_button.set_sensitive(True)
-                self.stop_button.set_sensitive(False)
+                self._set_connected(False)
                 self.update_status_text("Disconnected")
             else:
                 # Even if disconnect fails, update button states based on actual status
                 self.update_status()
-                self.show_error(f"Disconnect failed: {result.stderr}")
-                
-        self.run_command(["openvpn3", "session-manage", "--session-path", session_path, "--disconnect"], disconnect_done)
+                self.show_error(f"Disconnect failed: {error}")
+        
+        if self._bus is not None:
+            self.dbus_call(OVPN3_SESSIONS_SERVICE, session_path, OVPN3_SESSIONS_SERVICE, "Disconnect",
+                           callback=lambda reply, error: disconnect_done(error))
+        else:
+            self.run_command(
+                ["openvpn3", "session-manage", "--session-path", session_path, "--disconnect"],
+                lambda result: disconnect_done(None if result.returncode == 0 else result.stderr),
+                capture=False
+            )
+        
+    def poll_status(self):
+        """Periodic tick: traffic stats, or full status when D-Bus signals are unavailable"""
+        if self.current_session:
+            # Stats alone tell whether the known session is still up
+            self.check_session_status(self.current_session)
+        elif self._bus is None:
+            # No signals to announce new sessions - look for one
+            self.update_status()
+        return True  # Continue periodic updates
+    
+    def _on_window_state(self, widget, event):
+        """Stop polling while minimized and catch up when restored"""
+        if not event.changed_mask & Gdk.WindowState.ICONIFIED:
+            return False
+        if event.new_window_state & Gdk.WindowState.ICONIFIED:
+            if self._status_timeout_id:
+                GLib.source_remove(self._status_timeout_id)
+                self._status_timeout_id = -1  # Paused, resume on restore
+        elif self._status_timeout_id == -1:
+            self.update_status()
+            self._status_timeout_id = GLib.timeout_add_seconds(2, self.poll_status)
+        return False
+    
+    def _on_status_change(self, connection, sender, object_path, interface, signal, parameters):
+        """Handle a StatusChange signal from an OpenVPN3 session"""
+        major, minor, message = parameters.unpack()
+        if self.debug_mode:
+            print(f"StatusChange {object_path}: {major}/{minor} {message}")
+        
+        if major != STATUS_MAJOR_CONNECTION:
+            return
         
+        if minor == STATUS_MINOR_CONN_CONNECTED:
+            self.current_session = object_path
+            self._set_connected(True)
+            self.check_session_status(object_path)
+        elif minor in (STATUS_MINOR_CONN_DISCONNECTED, STATUS_MINOR_CONN_FAILED,
+                       STATUS_MINOR_CONN_AUTH_FAILED, STATUS_MINOR_CONN_DONE):
+            # Ignore other sessions going away while ours is still up
+            if self.current_session and self.current_session != object_path:
+                return
+            self.current_session = None
+            if not self.is_connecting:
+                self._set_connected(False)
+                self.update_status_text("Disconnected")
+        elif message and not self.current_session:
+            # Intermediate states (connecting, reconnecting, ...)
+            self.update_status_text(message)
+    
     def update_status(self):
         """Update connection status"""
-        def process_status(result):
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse sessions and check their actual status
-                lines = result.stdout.strip().split('\n')
-                session_paths = []
-                
-                for line in lines:
-                    # Look for session paths
-                    if '/net/openvpn/v3/sessions/' in line:
-                        # Extract the session path
-                        parts = line.split()
-                        for part in parts:
-                            if '/net/openvpn/v3/sessions/' in part:
-                                session_paths.append(part)
-                                break
-                
-                if session_paths:
-                    # Check the actual status of each session
-                    self.check_session_status(session_paths[0])  # Check first session
-                else:
-                    # No sessions found
-                    if not getattr(self, 'is_connecting', False):
-                        self.stop_button.set_sensitive(False)
-                        self.start_button.set_sensitive(True)
-                        self.update_status_text("Disconnected")
+        def process_status(session_paths):
+            if session_paths:
+                # Check the actual status of each session
+                self.check_session_status(session_paths[0])  # Check first session
             else:
                 # No sessions or error
                 if not getattr(self, 'is_connecting', False):
                     self.update_status_text("Disconnected")
-                    self.start_button.set_sensitive(True)
-                    self.stop_button.set_sensitive(False)
+                    self._set_connected(False)
                 
-        self.run_command(["openvpn3", "sessions-list"], process_status)
-        return True  # Continue periodic updates
+        self.fetch_sessions(process_status, cache_ttl=3)
+        return False  # One-shot; periodic refresh is driven by poll_status
     
     def check_session_status(self, session_path):
         """Check the actual status of a specific session"""
-        def process_session_status(result):
-            # Check if session-stats command succeeded
+        def show_connected(stats_text, bytes_in_value, bytes_out_value):
+            # Session exists and returned stats - it's connected
+            self.current_session = session_path
+            self._set_connected(True)
             
-            # If session-stats works, the session exists
-            # OpenVPN3 will return an error if the session doesn't exist or isn't connected
-            if result.returncode == 0:
-                # Session exists and returned stats - it's connected
-                self.current_session = session_path
-                self.stop_button.set_sensitive(True)
-                self.start_button.set_sensitive(False)
-                
-                # Parse some basic stats for display
-                stats_text = "Connected\n\n"
-                bytes_in_value = 0
-                bytes_out_value = 0
-                
-                if "BYTES_IN" in result.stdout:
-                    stats_text += f"Session: {session_path[-12:]}\n\n"
-                    # Extract some key stats
-                    for line in result.stdout.split('\n'):
-                        # Look for BYTES_IN but not TUN_BYTES_IN
-                        if 'BYTES_IN' in line and not line.strip().startswith('TUN_'):
-                            try:
-                                # Format is: "     BYTES_IN....................9438"
-                                # Split by dots and get the last part
-                                if '.' in line:
-                                    # Get everything after the dots
-                                    value_str = line.split('.')[-1].strip()
-                                    bytes_in_value = int(value_str)
-                            except:
-                                pass
-                            stats_text += line + "\n"
-                        # Look for BYTES_OUT but not TUN_BYTES_OUT
-                        elif 'BYTES_OUT' in line and not line.strip().startswith('TUN_'):
-                            try:
-                                # Format is: "     BYTES_OUT...................3599"
-                                if '.' in line:
-                                    value_str = line.split('.')[-1].strip()
-                                    bytes_out_value = int(value_str)
-                            except:
-                                pass
-                            stats_text += line + "\n"
-                        elif 'CONNECTED' in line:
-                            stats_text += line + "\n"
-                else:
-                    stats_text += f"Session: {session_path}\n\n{result.stdout[:500]}"
-                
-                # Update chart data
-                self.update_chart_data(bytes_in_value, bytes_out_value)
-                
-                self.update_status_text(stats_text)
+            # Update chart data
+            self.update_chart_data(bytes_in_value, bytes_out_value)
+            
+            self.update_status_text(stats_text)
+        
+        def show_gone():
+            # Error getting stats usually means session is gone or disconnected
+            if not getattr(self, 'is_connecting', False):
+                self.current_session = None
+                self._set_connected(False)
+                self.update_status_text("Disconnected")
+        
+        def process_statistics(stats, error):
+            # The session object refuses the property once it is gone
+            if error is not None:
+                show_gone()
+                return
+            stats_text = f"Connected\n\nSession: {session_path[-12:]}\n\n"
+            for key in ("BYTES_IN", "BYTES_OUT"):
+                if key in stats:
+                    stats_text += f"     {key:.<28}{stats[key]}\n"
+            show_connected(stats_text, stats.get("BYTES_IN", 0), stats.get("BYTES_OUT", 0))
+        
+        def process_session_status(result):
+            # session-stats fails once the session is gone or no longer connected
+            if result.returncode != 0:
+                show_gone()
+                return
+            stats = {key: int(value) for key, value in STATS_RE.findall(result.stdout)}
+            if stats:
+                process_statistics(stats, None)
             else:
-                # Error getting stats usually means session is gone or disconnected
-                if not getattr(self, 'is_connecting', False):
-                    self.stop_button.set_sensitive(False)
-                    self.start_button.set_sensitive(True)
-                    self.update_status_text("Disconnected")
+                show_connected(f"Connected\n\nSession: {session_path}\n\n{result.stdout[:500]}", 0, 0)
         
         # Get detailed status of the session
-        self.run_command(["openvpn3", "session-stats", "--session-path", session_path], process_session_status)
+        if self._bus is not None:
+            self.dbus_get_property(OVPN3_SESSIONS_SERVICE, session_path, OVPN3_SESSIONS_SERVICE,
+                                   "statistics", process_statistics)
+        else:
+            self.run_command(["openvpn3", "session-stats", "--session-path", session_path], process_session_status)
         
+    def _set_connected(self, connected):
+        """Set Connect/Disconnect sensitivity; connected=None means a connect is in progress
+        
+        Skips the widget updates when the state is unchanged, so repeated
+        status refreshes do not emit notify::sensitive and redraw the buttons.
+        """
+        if connected == self._connected:
+            return
+        self._connected = connected
+        self.start_button.set_sensitive(connected is False)
+        # While connecting, Disconnect stays available to cancel the attempt
+        self.stop_button.set_sensitive(connected is not False)
+    
     def update_status_text(self, text):
-        """Update status text in UI"""
-        self.status_buffer.set_text(text)
+        """Update status text in UI
+        
+        Several updates within one main loop iteration are coalesced; only the
+        last text is written to the buffer.
+        """
+        if not self._status_idle_id and text == self._last_status_text:
+            return  # Already showing this text
+        self._pending_status = text
+        if not self._status_idle_id:
+            self._status_idle_id = GLib.idle_add(self._flush_status, priority=GLib.PRIORITY_DEFAULT_IDLE)
+    
+    def _flush_status(self):
+        """Write the pending status text to the buffer"""
+        # Re-setting identical text would still invalidate and reflow the view
+        if self._pending_status != self._last_status_text:
+            self._last_status_text = self._pending_status
+            self.status_buffer.set_text(self._pending_status)
+        self._pending_status = None
+        self._status_idle_id = 0
+        return False
     
     def update_chart_data(self, bytes_in, bytes_out):
         """Update chart with new traffic data"""
@@ -586,7 +1327,8 @@ class VPNManager(Gtk.Window):
         else:
             out_rate = 0
         
-        # Add to history
+        # Add to history; the deques are full, so the oldest point drops off
+        evicted = max(self.bytes_in_history[0], self.bytes_out_history[0])
         self.bytes_in_history.append(in_rate)
         self.bytes_out_history.append(out_rate)
         
@@ -594,119 +1336,172 @@ class VPNManager(Gtk.Window):
         self.last_bytes_in = bytes_in
         self.last_bytes_out = bytes_out
         
-        # Update max value for scaling
-        max_rate = max(max(self.bytes_in_history), max(self.bytes_out_history))
-        if max_rate > 0:
+        # Update max value for scaling; rescan only when the peak scrolled off
+        new_rate = max(in_rate, out_rate)
+        if new_rate >= self.chart_peak_rate:
+            self.chart_peak_rate = new_rate
+        elif evicted >= self.chart_peak_rate:
+            self.chart_peak_rate = max(max(self.bytes_in_history), max(self.bytes_out_history))
+        if self.chart_peak_rate > 0:
             # Add some padding to the max value
-            self.chart_max_value = max_rate * 1.2
-        
-        # Update stats label
-        in_total_mb = bytes_in / (1024 * 1024) if bytes_in > 0 else 0
-        out_total_mb = bytes_out / (1024 * 1024) if bytes_out > 0 else 0
-        in_rate_kb = in_rate / 1024 if in_rate > 0 else 0
-        out_rate_kb = out_rate / 1024 if out_rate > 0 else 0
+            self.chart_max_value = self.chart_peak_rate * 1.2
+        
+        # Only touch the chart widgets while the Traffic Chart tab is on screen;
+        # switching to it refreshes the label and draws the current history
+        if not self.chart_area.get_mapped():
+            # Drop the stale rendering so the next draw renders afresh
+            self._chart_surface = None
+        elif not self._chart_redraw_id:
+            # Batch samples that arrive in quick succession into one redraw,
+            # at most CHART_REDRAW_INTERVAL_MS apart
+            self._chart_redraw_id = GLib.timeout_add(CHART_REDRAW_INTERVAL_MS, self._redraw_chart)
+    
+    def _redraw_chart(self):
+        """Throttled chart refresh scheduled by update_chart_data"""
+        self._chart_redraw_id = 0
+        self.update_chart_label()
+        self.render_chart_surface()
+        self.chart_area.queue_draw()
+        return False
+    
+    def update_chart_label(self):
+        """Show the latest totals and rates under the chart"""
+        in_total_mb = self.last_bytes_in / (1024 * 1024)
+        out_total_mb = self.last_bytes_out / (1024 * 1024)
+        in_rate_kb = self.bytes_in_history[-1] / 1024
+        out_rate_kb = self.bytes_out_history[-1] / 1024
         
         self.chart_stats_label.set_markup(
             f"<small>Total: In {in_total_mb:.1f}MB / Out {out_total_mb:.1f}MB | "
             f"Rate: In {in_rate_kb:.1f}KB/s / Out {out_rate_kb:.1f}KB/s</small>"
         )
-        
-        # Redraw chart
-        self.chart_area.queue_draw()
+    
+    def on_status_page_switched(self, notebook, page, page_num):
+        """Bring the chart label up to date when its tab is shown"""
+        if page_num == self.chart_page and self.last_bytes_in + self.last_bytes_out > 0:
+            self.update_chart_label()
+    
+    def get_chart_background(self, width, height):
+        """Return the chart background, grid and axes, recorded once per size"""
+        if self._grid_cache_size != (width, height):
+            surface = cairo.RecordingSurface(cairo.CONTENT_COLOR_ALPHA, (0, 0, width, height))
+            cr = cairo.Context(surface)
+            
+            # Background - white
+            cr.set_source_rgb(1.0, 1.0, 1.0)
+            cr.rectangle(0, 0, width, height)
+            cr.fill()
+            
+            # Draw grid
+            cr.set_source_rgba(0.8, 0.8, 0.8, 0.5)
+            cr.set_line_width(0.5)
+            
+            # Horizontal grid lines (5 lines)
+            for i in range(5):
+                y = int(height * i / 4)
+                cr.move_to(0, y)
+                cr.line_to(width, y)
+            cr.stroke()
+            
+            # Vertical grid lines (every 10 data points)
+            grid_spacing = 10
+            for i in range(0, self.chart_data_points + 1, grid_spacing):
+                x = int(width * i / self.chart_data_points)
+                cr.move_to(x, 0)
+                cr.line_to(x, height)
+            cr.stroke()
+            
+            # Draw axes
+            cr.set_source_rgb(0.3, 0.3, 0.3)
+            cr.set_line_width(1.5)
+            cr.move_to(0, height - 1)
+            cr.line_to(width, height - 1)
+            cr.move_to(1, 0)
+            cr.line_to(1, height)
+            cr.stroke()
+            
+            self._grid_cache = surface
+            self._grid_cache_size = (width, height)
+        return self._grid_cache
     
     def on_chart_draw(self, widget, cr):
-        """Draw the traffic chart"""
-        allocation = widget.get_allocation()
-        width = allocation.width
-        height = allocation.height
-        
-        # Ensure we have valid dimensions
-        if width <= 0 or height <= 0:
+        """Draw the traffic chart by copying the off-screen rendering"""
+        size = (widget.get_allocated_width(), widget.get_allocated_height())
+        if self._chart_surface is None or self._chart_surface_size != size:
+            # First draw or resized - new data re-renders in _redraw_chart
+            self.render_chart_surface()
+        if self._chart_surface is None:
             return False
         
-        # Background - white
-        cr.set_source_rgb(1.0, 1.0, 1.0)
-        cr.rectangle(0, 0, width, height)
-        cr.fill()
-        
-        # Draw grid
-        cr.set_source_rgba(0.8, 0.8, 0.8, 0.5)
-        cr.set_line_width(0.5)
-        
-        # Horizontal grid lines (5 lines)
-        for i in range(5):
-            y = int(height * i / 4)
-            cr.move_to(0, y)
-            cr.line_to(width, y)
-        cr.stroke()
+        cr.set_source_surface(self._chart_surface, 0, 0)
+        cr.paint()
+        return False
+    
+    def render_chart_surface(self):
+        """Render the chart into the off-screen surface that on_chart_draw copies"""
+        window = self.chart_area.get_window()
+        width = self.chart_area.get_allocated_width()
+        height = self.chart_area.get_allocated_height()
         
-        # Vertical grid lines (every 10 data points)
-        grid_spacing = 10
-        for i in range(0, self.chart_data_points + 1, grid_spacing):
-            x = int(width * i / self.chart_data_points)
-            cr.move_to(x, 0)
-            cr.line_to(x, height)
-        cr.stroke()
+        # Ensure we have valid dimensions
+        if window is None or width <= 0 or height <= 0:
+            self._chart_surface = None
+            return
         
-        # Draw axes
-        cr.set_source_rgb(0.3, 0.3, 0.3)
-        cr.set_line_width(1.5)
-        cr.move_to(0, height - 1)
-        cr.line_to(width, height - 1)
-        cr.move_to(1, 0)
-        cr.line_to(1, height)
-        cr.stroke()
+        if self._chart_surface is None or self._chart_surface_size != (width, height):
+            # Similar surface so the copy matches the window's format and scale
+            self._chart_surface = window.create_similar_surface(cairo.CONTENT_COLOR_ALPHA, width, height)
+            self._chart_surface_size = (width, height)
+        self.render_chart(cairo.Context(self._chart_surface), width, height)
+    
+    def render_chart(self, cr, width, height):
+        """Draw the traffic chart onto cr"""
+        # Static background, grid and axes - replayed from a recording
+        cr.set_source_surface(self.get_chart_background(width, height), 0, 0)
+        cr.paint()
         
         # Draw data if we have any
         if self.chart_max_value > 0 and len(self.bytes_in_history) > 1:
-            # Calculate point spacing
-            point_spacing = width / max(1, (self.chart_data_points - 1))
-            
-            # Draw filled area for bytes out (blue)
-            cr.set_source_rgba(0.13, 0.59, 0.95, 0.3)  # Semi-transparent blue
-            cr.move_to(0, height)
-            for i, value in enumerate(self.bytes_out_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)  # Use 85% of height
-                cr.line_to(x, y)
-            cr.line_to(width, height)
-            cr.close_path()
-            cr.fill()
-            
-            # Draw line for bytes out (blue)
-            cr.set_source_rgb(0.13, 0.59, 0.95)  # #2196F3
-            cr.set_line_width(2)
-            for i, value in enumerate(self.bytes_out_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                if i == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
-            cr.stroke()
+            # X positions only change with the width
+            if self._chart_xs_width != width:
+                point_spacing = width / max(1, (self.chart_data_points - 1))
+                self._chart_xs = [i * point_spacing for i in range(self.chart_data_points)]
+                self._chart_xs_width = width
+            xs = self._chart_xs
             
-            # Draw filled area for bytes in (green)
-            cr.set_source_rgba(0.30, 0.69, 0.31, 0.3)  # Semi-transparent green
-            cr.move_to(0, height)
-            for i, value in enumerate(self.bytes_in_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                cr.line_to(x, y)
-            cr.line_to(width, height)
-            cr.close_path()
-            cr.fill()
+            scale = height * 0.85 / self.chart_max_value  # Use 85% of height
             
-            # Draw line for bytes in (green)
-            cr.set_source_rgb(0.30, 0.69, 0.31)  # #4CAF50
-            cr.set_line_width(2)
-            for i, value in enumerate(self.bytes_in_history):
-                x = i * point_spacing
-                y = height - (value / self.chart_max_value * height * 0.85)
-                if i == 0:
-                    cr.move_to(x, y)
-                else:
-                    cr.line_to(x, y)
-            cr.stroke()
+            # Bytes out (blue, #2196F3) first, then bytes in (green, #4CAF50) on top
+            series = (
+                (self.bytes_out_history, (0.13, 0.59, 0.95)),
+                (self.bytes_in_history, (0.30, 0.69, 0.31)),
+            )
+            line_to = cr.line_to  # Bound once for the per-point loops
+            # Cheaper antialiasing is plenty for a 60-point traffic plot; line cap
+            # and join stay at cairo's defaults (butt, miter). Saved and restored
+            # so it only applies to the series, not the border below
+            cr.save()
+            cr.set_antialias(cairo.ANTIALIAS_FAST)
+            for history, (r, g, b) in series:
+                # Trace the polyline once and reuse it for both the fill and the line
+                cr.new_path()
+                for x, value in zip(xs, history):
+                    line_to(x, height - value * scale)
+                line = cr.copy_path()
+                
+                # Filled area down to the X axis (semi-transparent)
+                cr.line_to(width, height)
+                cr.line_to(0, height)
+                cr.close_path()
+                cr.set_source_rgba(r, g, b, 0.3)
+                cr.fill()
+                
+                # Line on top of the area
+                cr.append_path(line)
+                cr.set_source_rgb(r, g, b)
+                cr.set_line_width(2)
+                cr.stroke()
+            cr.restore()
         else:
             # No data - show message
             cr.set_source_rgb(0.5, 0.5, 0.5)
@@ -725,112 +1520,122 @@ class VPNManager(Gtk.Window):
         cr.rectangle(0.5, 0.5, width - 1, height - 1)
         cr.stroke()
         
-        return False
-        
     def cleanup_stale_sessions(self, widget=None):
         """Clean up stale VPN sessions"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.QUESTION,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text="Clean Up Stale Sessions?"
-        )
-        dialog.format_secondary_text(
+        response = self.run_message_dialog(
+            Gtk.MessageType.QUESTION, Gtk.ButtonsType.YES_NO,
+            "Clean Up Stale Sessions?",
             "This will disconnect ALL VPN sessions, including any that might be active.\n\n"
             "This is useful when sessions weren't properly closed and are preventing new connections.\n\n"
             "Continue?"
         )
         
-        response = dialog.run()
-        dialog.destroy()
-        
         if response == Gtk.ResponseType.YES:
-            def cleanup_done(result):
+            def report(cleaned, errors):
+                self.invalidate_command_cache(["openvpn3", "sessions-list"])
+                
+                # Show results
+                if cleaned > 0:
+                    message = f"Successfully cleaned up {cleaned} session(s)."
+                    if errors:
+                        message += f"\n\nErrors:\n" + "\n".join(errors)
+                    self.show_info(message)
+                else:
+                    self.show_error("Failed to clean up sessions:\n" + "\n".join(errors))
+                
+                # Update status
+                self.update_status()
+            
+            def cleanup_done(session_paths):
+                if session_paths is None:
+                    self.show_info("No active sessions to clean up.")
+                    return
+                if not session_paths:
+                    self.show_info("No sessions found to clean up.")
+                    return
+                
+                # Disconnect all sessions at once and report when every reply is in
                 cleaned = 0
                 errors = []
                 
-                if result.returncode == 0 and result.stdout.strip():
-                    lines = result.stdout.strip().split('\n')
-                    session_paths = []
-                    
-                    for line in lines:
-                        if '/net/openvpn/v3/sessions/' in line:
-                            parts = line.split()
-                            for part in parts:
-                                if '/net/openvpn/v3/sessions/' in part:
-                                    session_paths.append(part)
-                                    break
-                    
-                    if session_paths:
-                        # Disconnect each session
-                        for session_path in session_paths:
-                            try:
-                                disconnect_result = subprocess.run(
-                                    ["openvpn3", "session-manage", "--session-path", session_path, "--disconnect"],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=5
-                                )
-                                if disconnect_result.returncode == 0:
-                                    cleaned += 1
-                                    print(f"Cleaned up session: {session_path}")
-                                else:
-                                    errors.append(f"Failed to clean {session_path}")
-                            except Exception as e:
-                                errors.append(f"Error cleaning {session_path}: {str(e)}")
-                        
-                        # Show results
-                        if cleaned > 0:
-                            message = f"Successfully cleaned up {cleaned} session(s)."
-                            if errors:
-                                message += f"\n\nErrors:\n" + "\n".join(errors)
-                            self.show_info(message)
-                        else:
-                            self.show_error("Failed to clean up sessions:\n" + "\n".join(errors))
-                        
-                        # Update status
-                        self.update_status()
+                def disconnected(error, session_path):
+                    nonlocal cleaned
+                    if error is None:
+                        cleaned += 1
+                        print(f"Cleaned up session: {session_path}")
                     else:
-                        self.show_info("No sessions found to clean up.")
-                else:
-                    self.show_info("No active sessions to clean up.")
+                        errors.append(f"Failed to clean {session_path}: {error}")
+                    if cleaned + len(errors) == len(session_paths):
+                        report(cleaned, errors)
+                
+                def command_done(result, session_path):
+                    if result.returncode == 0:
+                        disconnected(None, session_path)
+                    else:
+                        disconnected(result.stderr.strip() or f"exit status {result.returncode}", session_path)
+                
+                for session_path in session_paths:
+                    if self._bus is not None:
+                        self.dbus_call(
+                            OVPN3_SESSIONS_SERVICE, session_path, OVPN3_SESSIONS_SERVICE, "Disconnect",
+                            callback=lambda reply, error, session_path=session_path: disconnected(error, session_path)
+                        )
+                    else:
+                        # Child processes run side by side; the main loop collects them
+                        self.run_command(
+                            ["openvpn3", "session-manage", "--session-path", session_path, "--disconnect"],
+                            lambda result, session_path=session_path: command_done(result, session_path),
+                            capture=False
+                        )
                     
             # Get list of all sessions
-            self.run_command(["openvpn3", "sessions-list"], cleanup_done)
+            self.fetch_sessions(cleanup_done)
+    
+    def run_message_dialog(self, message_type, buttons, text, secondary_text=None):
+        """Run a message dialog, reusing a hidden one per (type, buttons); returns the response"""
+        key = (message_type, buttons)
+        dialog = self._message_dialogs.get(key)
+        if dialog is None or dialog.get_visible():
+            # A nested call while the cached dialog is still up gets its own
+            dialog = Gtk.MessageDialog(
+                transient_for=self,
+                flags=0,
+                message_type=message_type,
+                buttons=buttons,
+                text=""
+            )
+            self._message_dialogs.setdefault(key, dialog)
+        
+        dialog.set_property("text", text)
+        dialog.set_property("secondary-text", secondary_text)
+        response = dialog.run()
+        dialog.hide()
+        if self._message_dialogs[key] is not dialog:
+            dialog.destroy()
+        return response
     
     def show_error(self, message):
         """Show error dialog"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.ERROR,
-            buttons=Gtk.ButtonsType.OK,
-            text=message
-        )
-        dialog.run()
-        dialog.destroy()
+        self.run_message_dialog(Gtk.MessageType.ERROR, Gtk.ButtonsType.OK, message)
     
     def check_openvpn3_installed(self):
         """Check if openvpn3 is installed"""
-        return shutil.which("openvpn3") is not None
+        return self.which("openvpn3") is not None
+    
+    def which(self, name):
+        """shutil.which() with the result remembered for the life of the process"""
+        if name not in self._which_cache:
+            self._which_cache[name] = shutil.which(name)
+        return self._which_cache[name]
     
     def show_install_prompt(self):
         """Show prompt to install OpenVPN3"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.WARNING,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text="OpenVPN3 Not Found"
-        )
-        dialog.format_secondary_text(
+        response = self.run_message_dialog(
+            Gtk.MessageType.WARNING, Gtk.ButtonsType.YES_NO,
+            "OpenVPN3 Not Found",
             "OpenVPN3 is not installed on your system. Would you like to install it?"
         )
         
-        response = dialog.run()
-        dialog.destroy()
-        
         if response == Gtk.ResponseType.YES:
             self.show_install_dialog()
     
@@ -870,19 +1675,10 @@ class VPNManager(Gtk.Window):
         text_view.set_wrap_mode(Gtk.WrapMode.WORD)
         scrolled.add(text_view)
         
-        # Detect distribution
-        dist_info = self.get_distribution_info()
-        
-        commands = self.get_install_commands(dist_info)
+        commands = self.install_commands
         
         buffer = text_view.get_buffer()
-        buffer.set_text(
-            "Installation Instructions:\n\n"
-            "The following commands will be executed to install OpenVPN3:\n\n"
-            + commands + "\n\n"
-            "Click 'Install Automatically' to run these commands (requires sudo password)\n"
-            "Click 'Copy Commands' to copy them to clipboard for manual execution\n"
-        )
+        buffer.set_text(INSTALL_DIALOG_HEADER + commands + INSTALL_DIALOG_FOOTER)
         
         dialog.show_all()
         response = dialog.run()
@@ -892,37 +1688,38 @@ class VPNManager(Gtk.Window):
             self.run_installation(commands)
         elif response == Gtk.ResponseType.APPLY:
             # Copy to clipboard
-            clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-            clipboard.set_text(commands, -1)
+            self._clipboard.set_text(commands, -1)
             dialog.destroy()
             self.show_info("Commands copied to clipboard. Run them in a terminal with sudo privileges.")
         else:
             dialog.destroy()
     
+    @property
+    def install_commands(self):
+        """Install commands for this host, built once (arch and distro cannot change)"""
+        if self._install_commands is None:
+            self._install_commands = self.get_install_commands(self.get_distribution_info())
+        return self._install_commands
+    
+    @functools.lru_cache(maxsize=1)
     def get_distribution_info(self):
-        """Get distribution information"""
+        """Get distribution information (read once; it cannot change while running)"""
         try:
-            # Try to read os-release file
-            with open('/etc/os-release', 'r') as f:
-                lines = f.readlines()
-                info = {}
-                for line in lines:
-                    if '=' in line:
-                        key, value = line.strip().split('=', 1)
-                        info[key] = value.strip('"')
-                
-                # Determine Ubuntu base version for Mint
-                if 'Linux Mint' in info.get('NAME', ''):
-                    version = info.get('VERSION_ID', '22')
-                    if version.startswith('22'):
-                        return 'noble'  # Ubuntu 24.04
-                    elif version.startswith('21'):
-                        return 'jammy'  # Ubuntu 22.04
-                    elif version.startswith('20'):
-                        return 'focal'  # Ubuntu 20.04
-                elif 'Ubuntu' in info.get('NAME', ''):
-                    codename = info.get('VERSION_CODENAME', 'noble')
-                    return codename
+            if hasattr(platform, 'freedesktop_os_release'):
+                # Python 3.10+ parses (and caches) os-release itself
+                info = platform.freedesktop_os_release()
+            else:
+                # Try to read os-release file
+                with open('/etc/os-release', 'r') as f:
+                    info = {key: quoted or bare for key, quoted, bare in OS_RELEASE_RE.findall(f.read())}
+            
+            # Determine Ubuntu base version for Mint
+            if 'Linux Mint' in info.get('NAME', ''):
+                version = info.get('VERSION_ID', '22')
+                return MINT_UBUNTU_BASES.get(version[:2], 'noble')
+            elif 'Ubuntu' in info.get('NAME', ''):
+                codename = info.get('VERSION_CODENAME', 'noble')
+                return codename
         except:
             pass
         
@@ -936,61 +1733,7 @@ class VPNManager(Gtk.Window):
         elif arch == 'aarch64':
             arch = 'arm64'
         
-        commands = f"""# Install prerequisites
-sudo apt update
-sudo apt install -y apt-transport-https curl gpg
-
-# Create keyrings directory if it doesn't exist (for newer apt versions)
-sudo mkdir -p /etc/apt/keyrings
-
-# Add OpenVPN repository key
-# Download and save the GPG key directly (without dearmor for ASCII-armored keys)
-curl -fsSL https://packages.openvpn.net/packages-repo.gpg | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
-
-# Verify the key was added successfully
-if [ ! -f /etc/apt/keyrings/openvpn.asc ]; then
-    echo "Error: Failed to download GPG key. Trying alternative method..."
-    # Alternative: Try with wget if curl fails
-    wget -qO- https://packages.openvpn.net/packages-repo.gpg | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
-fi
-
-# Add OpenVPN3 repository
-echo "deb [arch={arch} signed-by=/etc/apt/keyrings/openvpn.asc] https://packages.openvpn.net/openvpn3/debian {dist_codename} main" | sudo tee /etc/apt/sources.list.d/openvpn3.list
-
-# Update package lists
-echo ""
-echo "Updating package lists..."
-sudo apt update
-
-# Check if update succeeded (no GPG errors)
-if sudo apt update 2>&1 | grep -q "NO_PUBKEY"; then
-    echo ""
-    echo "Warning: GPG key verification issue detected."
-    echo "Attempting to fix by re-downloading the key..."
-    
-    # Try alternative key URL
-    curl -fsSL https://swupdate.openvpn.net/repos/openvpn-repo-pkg-key.pub | sudo tee /etc/apt/keyrings/openvpn.asc > /dev/null
-    
-    # Update again
-    sudo apt update
-fi
-
-# Install OpenVPN3
-echo ""
-echo "Installing OpenVPN3..."
-sudo apt install -y openvpn3
-
-# Optional: Install Python keyring for secure credential storage
-echo ""
-echo "Installing Python keyring for secure credential storage..."
-echo "Using apt method (recommended for Linux Mint 22 / Ubuntu 24.04+)..."
-sudo apt install -y python3-keyring python3-secretstorage gnome-keyring
-
-echo ""
-echo "✓ Keyring support packages installed"
-"""
-        
-        return commands
+        return INSTALL_COMMANDS_TEMPLATE.format(arch=arch, dist_codename=dist_codename)
     
     def run_installation(self, commands):
         """Run installation commands"""
@@ -998,96 +1741,87 @@ echo "✓ Keyring support packages installed"
         terminal_cmd = self.get_terminal_command(commands)
         
         if terminal_cmd:
-            subprocess.Popen(terminal_cmd, shell=True)
+            subprocess.Popen(terminal_cmd)
             
-            dialog = Gtk.MessageDialog(
-                transient_for=self,
-                flags=0,
-                message_type=Gtk.MessageType.INFO,
-                buttons=Gtk.ButtonsType.OK,
-                text="Installation Started"
-            )
-            dialog.format_secondary_text(
+            self.run_message_dialog(
+                Gtk.MessageType.INFO, Gtk.ButtonsType.OK,
+                "Installation Started",
                 "The installation has been started in a new terminal window.\n"
                 "Please enter your sudo password when prompted.\n"
                 "After installation completes, restart this application."
-            )
-            dialog.run()
-            dialog.destroy()
+            )
         else:
             self.show_error("Could not determine terminal emulator. Please copy commands and run manually.")
     
     def get_terminal_command(self, commands):
         """Get the appropriate terminal command for the system"""
         # Save commands to a temporary script
-        script_path = "/tmp/install_openvpn3.sh"
-        with open(script_path, 'w') as f:
-            f.write("#!/bin/bash\n")
-            f.write(commands)
-            f.write("\necho \"\n✓ Installation complete!\"\n")
-            f.write("echo \"\nThe VPN GUI is now ready to use with secure credential storage.\"\n")
-            f.write("echo \"Press Enter to close...\"\n")
-            f.write("read\n")
-        
-        os.chmod(script_path, 0o755)
-        
-        # Try different terminal emulators
-        terminals = [
-            ("gnome-terminal", f"gnome-terminal -- bash {script_path}"),
-            ("xfce4-terminal", f"xfce4-terminal -e 'bash {script_path}'"),
-            ("mate-terminal", f"mate-terminal -e 'bash {script_path}'"),
-            ("konsole", f"konsole -e bash {script_path}"),
-            ("xterm", f"xterm -e bash {script_path}"),
-        ]
-        
-        for term_name, term_cmd in terminals:
-            if shutil.which(term_name):
-                return term_cmd
+        # Use one unpredictable, owner-only temp file per process instead of a
+        # fixed /tmp path, and only rewrite it when the commands change
+        if self._install_script_path is None or not os.path.exists(self._install_script_path):
+            with tempfile.NamedTemporaryFile(mode='w', prefix='install_openvpn3_', suffix='.sh', delete=False) as f:
+                self._install_script_path = f.name
+            self._install_script_commands = None
+        script_path = self._install_script_path
+        
+        if commands != self._install_script_commands:
+            with open(script_path, 'w') as f:
+                f.write("#!/bin/bash\n")
+                f.write(commands)
+                f.write("\necho \"\n✓ Installation complete!\"\n")
+                f.write("echo \"\nThe VPN GUI is now ready to use with secure credential storage.\"\n")
+                f.write("echo \"Press Enter to close...\"\n")
+                f.write("read\n")
+            
+            os.chmod(script_path, 0o700)
+            self._install_script_commands = commands
         
-        return None
+        return self.terminal_command(["bash", script_path])
+    
+    def terminal_command(self, args):
+        """Argument list that runs the command args in a terminal emulator, or None"""
+        if self._terminal_argv is None:
+            # Try different terminal emulators; remember the first one found
+            for term_name, term_argv in TERMINAL_COMMANDS:
+                if self.which(term_name):
+                    self._terminal_argv = term_argv
+                    break
+            else:
+                return None
+        return self._terminal_argv + args
     
     def show_info(self, message):
         """Show info dialog"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text=message
-        )
-        dialog.run()
-        dialog.destroy()
+        self.run_message_dialog(Gtk.MessageType.INFO, Gtk.ButtonsType.OK, message)
+    
+    def dump_config(self, config_path):
+        """Return the imported config's text from 'openvpn3 config-dump', or None
+        
+        Blocking; results are kept until the config list is refreshed or a
+        config is imported. Failures other than a non-zero exit are raised.
+        """
+        if config_path in self._config_dump_cache:
+            return self._config_dump_cache[config_path]
+        cmd = ["openvpn3", "config-dump", "--config", config_path]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=command_timeout(cmd))
+        config_content = result.stdout if result.returncode == 0 else None
+        self._config_dump_cache[config_path] = config_content
+        return config_content
     
     def config_needs_credentials(self, config_path):
         """Check if config file needs credentials"""
         try:
             # Try to read the actual .ovpn file to check for auth-user-pass
             # First, we need to export the config to read it
-            result = subprocess.run(
-                ["openvpn3", "config-dump", "--config", config_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            config_content = self.dump_config(config_path)
             
-            if result.returncode == 0:
-                config_content = result.stdout
+            if config_content is not None:
                 # Check if auth-user-pass is present without a file path
                 # or if it points to a non-existent file
-                if "auth-user-pass" in config_content:
-                    lines = config_content.split('\n')
-                    for line in lines:
-                        if line.strip().startswith("auth-user-pass"):
-                            parts = line.strip().split()
-                            if len(parts) == 1:
-                                # auth-user-pass without file = needs credentials
-                                return True
-                            elif len(parts) > 1:
-                                # Check if file exists
-                                auth_file = parts[1]
-                                if not os.path.exists(os.path.expanduser(auth_file)):
-                                    return True
-                    return False
+                for match in AUTH_USER_PASS_RE.finditer(config_content):
+                    auth_file = match.group(1)
+                    if auth_file is None or not os.path.exists(expand_home(auth_file)):
+                        return True
                 return False
         except:
             # If we can't determine, assume it might need credentials
@@ -1099,13 +1833,27 @@ echo "✓ Keyring support packages installed"
         
         if not self.use_keyring:
             self.show_info("System keyring disabled. Passwords will be stored locally in encrypted file.")
-        elif not KEYRING_AVAILABLE:
+        elif not init_keyring():
             widget.set_active(False)
             self.use_keyring = False
             self.show_info("Keyring module not available. Please install it first:\nTools → Install Keyring Support")
         else:
+            if self.stored_credentials:
+                # Move what is stored so far into the keyring now
+                self.persist_credentials()
             self.show_info("System keyring enabled for secure password storage.")
     
+    def load_stored_credentials(self):
+        """Set up the keyring and load saved credentials (deferred from startup)"""
+        if self.use_keyring and not init_keyring():
+            # The backend turned out to be unusable - reflect that in the menu
+            self.use_keyring = False
+            self.keyring_toggle_item.handler_block_by_func(self.toggle_keyring_support)
+            self.keyring_toggle_item.set_active(False)
+            self.keyring_toggle_item.handler_unblock_by_func(self.toggle_keyring_support)
+        self.stored_credentials = self.load_credentials()
+        return False
+    
     def load_credentials(self):
         """Load stored credentials"""
         credentials = {}
@@ -1115,7 +1863,7 @@ echo "✓ Keyring support packages installed"
             try:
                 stored = keyring.get_password("vpn3gui", "credentials")
                 if stored:
-                    return json.loads(stored)
+                    return json_loads(stored)
             except Exception as e:
                 # Check for uninitialized keyring error
                 error_msg = str(e).lower()
@@ -1130,30 +1878,45 @@ echo "✓ Keyring support packages installed"
         # Fallback to file storage (less secure)
         if os.path.exists(self.credentials_file):
             try:
-                with open(self.credentials_file, 'r') as f:
-                    credentials = json.load(f)
-                # Set restrictive permissions
-                os.chmod(self.credentials_file, 0o600)
+                with open(self.credentials_file, 'rb') as f:
+                    # Tighten permissions only on files left readable by others
+                    # (persist_credentials always creates it owner-only)
+                    if os.fstat(f.fileno()).st_mode & 0o077:
+                        os.fchmod(f.fileno(), 0o600)
+                    credentials = json_loads(f.read())
             except:
                 pass
         
         return credentials
     
-    def save_credentials(self, config_name, username, password, remember=True):
-        """Save credentials securely"""
+    def save_credentials(self, config_name, username, password, remember=True, persist=True):
+        """Save credentials securely
+        
+        stored_credentials is the in-memory copy every lookup is served from;
+        storage is only written when the entry changed. With persist=False the
+        write is left to a later persist_credentials() call.
+        """
         if not remember:
             return
         
-        self.stored_credentials[config_name] = {
+        credential = {
             "username": username,
             "password": password
         }
-        
+        if self.stored_credentials.get(config_name) == credential and not self._keyring_pending:
+            return  # Unchanged and already stored - skip the keyring/file write
+        self.stored_credentials[config_name] = credential
+        if persist:
+            self.persist_credentials()
+    
+    def persist_credentials(self):
+        """Write stored_credentials to the keyring, or to the credentials file"""
         # Try keyring first if available and enabled
         if KEYRING_AVAILABLE and self.use_keyring:
             try:
                 keyring.set_password("vpn3gui", "credentials", 
-                                   json.dumps(self.stored_credentials))
+                                   json_dumps(self.stored_credentials).decode())
+                self._keyring_pending = False
                 return
             except Exception as e:
                 # Check for uninitialized keyring error
@@ -1165,12 +1928,19 @@ echo "✓ Keyring support packages installed"
                 # Fall back to file storage
                 pass
         
-        # Fallback to file storage
+        # Fallback to file storage; if the keyring was wanted, retry it on the next save
+        self._keyring_pending = KEYRING_AVAILABLE and self.use_keyring
         os.makedirs(os.path.dirname(self.credentials_file), exist_ok=True)
-        with open(self.credentials_file, 'w') as f:
-            json.dump(self.stored_credentials, f)
-        # Set restrictive permissions
-        os.chmod(self.credentials_file, 0o600)
+        # Write a private temp file and rename it over the old one, so a crash
+        # mid-write never leaves a truncated credentials.json behind
+        tmp_file = self.credentials_file + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            # Set restrictive permissions before any secret is written - a stale
+            # temp file left by a crash keeps its old mode despite O_CREAT's 0o600
+            os.fchmod(fd, 0o600)
+            f.write(json_dumps(self.stored_credentials))
+        os.replace(tmp_file, self.credentials_file)
     
     def get_credentials_for_config(self, config_name):
         """Get stored credentials for a config"""
@@ -1179,119 +1949,75 @@ echo "✓ Keyring support packages installed"
             return cred.get("username"), cred.get("password")
         return None, None
     
-    def create_temp_auth_file(self, username, password):
-        """Create temporary auth file with credentials"""
-        try:
-            # Create temp file with restrictive permissions
-            fd, path = tempfile.mkstemp(prefix="vpn_auth_", suffix=".txt")
-            with os.fdopen(fd, 'w') as f:
-                f.write(f"{username}\n{password}\n")
-            
-            # Set restrictive permissions
-            os.chmod(path, 0o600)
-            
-            # Track for cleanup
-            self.temp_auth_files.append(path)
-            
-            return path
-        except Exception as e:
-            print(f"Error creating auth file: {e}")
-            return None
-    
-    def cleanup_temp_files(self, widget=None):
-        """Clean up temporary auth files"""
-        for auth_file in self.temp_auth_files:
-            try:
-                if os.path.exists(auth_file):
-                    os.remove(auth_file)
-            except:
-                pass
-        self.temp_auth_files.clear()
-    
     def start_vpn_with_credentials(self, config_path, username, password):
         """Start VPN connection with provided credentials"""
         self.is_connecting = True  # Set flag to prevent status updates from interfering
+        self._connect_cancelled = False
         self.update_status_text("Connecting...")
-        self.start_button.set_sensitive(False)
+        self._set_connected(None)
         
         def start_done(result):
             self.is_connecting = False  # Clear connecting flag
-            if result.returncode == 0:
-                self.start_button.set_sensitive(False)
-                self.stop_button.set_sensitive(True)
+            self._connect_proc = None
+            self.invalidate_command_cache(["openvpn3", "sessions-list"])
+            if self._connect_cancelled:
+                self._set_connected(False)
+                self.update_status_text("Connection cancelled")
+                # A half-started session may have been left behind
+                GLib.timeout_add_seconds(2, self.update_status)
+            elif result.returncode == 0:
+                self._set_connected(True)
                 # Extract session path from output
                 session_found = False
-                for line in result.stdout.split('\n'):
-                    if 'Session path:' in line:
-                        self.current_session = line.split('Session path:')[1].strip()
+                _, sep, tail = result.stdout.partition('Session path:')
+                if sep:
+                    parts = tail.split(None, 1)
+                    if parts:
+                        self.current_session = parts[0]
                         session_found = True
-                        break
                 
                 if not session_found:
                     # Try to find session path in other formats
-                    if '/net/openvpn/v3/sessions/' in result.stdout:
-                        import re
-                        matches = re.findall(r'/net/openvpn/v3/sessions/[a-f0-9s]+', result.stdout)
-                        if matches:
-                            self.current_session = matches[0]
-                            session_found = True
+                    session_path = find_session_path(result.stdout)
+                    if session_path:
+                        self.current_session = session_path
+                        session_found = True
                 
-                # Force button states to be correct
-                self.start_button.set_sensitive(False)
-                self.stop_button.set_sensitive(True)
                 self.update_status_text(f"Connected Successfully\n\nSession: {self.current_session if self.current_session else 'Active'}")
                 
                 # Schedule a status update but not immediately
                 GLib.timeout_add_seconds(2, self.update_status)
             else:
-                self.start_button.set_sensitive(True)
+                self._set_connected(False)
                 # Check if it's an auth error
                 if "AUTH_FAILED" in result.stderr or "authentication" in result.stderr.lower():
                     response = self.show_question("Authentication failed. Would you like to re-enter credentials?")
                     if response:
-                        display_name = self.config_combo.get_active_text()
+                        display_name = self.get_selected_config()
                         self.show_credential_dialog(display_name, config_path, retry=True)
                 else:
                     self.show_error(f"Connection failed: {result.stderr}")
         
-        # Run the connection with credentials via stdin
-        def run():
-            try:
-                # Start the session with credentials
-                proc = subprocess.Popen(
-                    ["openvpn3", "session-start", "--config", config_path],
-                    stdin=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-                
-                # Provide credentials via stdin
-                stdout, stderr = proc.communicate(input=f"{username}\n{password}\n", timeout=30)
-                
-                result = subprocess.CompletedProcess(
-                    args=proc.args,
-                    returncode=proc.returncode,
-                    stdout=stdout,
-                    stderr=stderr
-                )
-                
-                GLib.idle_add(start_done, result)
-            except subprocess.TimeoutExpired:
-                self.is_connecting = False  # Clear connecting flag on error
-                GLib.idle_add(self.show_error, "Connection timed out")
-                GLib.idle_add(lambda: self.start_button.set_sensitive(True))
-            except Exception as e:
-                self.is_connecting = False  # Clear connecting flag on error
-                GLib.idle_add(self.show_error, str(e))
-                GLib.idle_add(lambda: self.start_button.set_sensitive(True))
-        
-        thread = threading.Thread(target=run)
-        thread.daemon = True
-        thread.start()
+        def start_failed(message):
+            self.is_connecting = False  # Clear connecting flag on error
+            self._connect_proc = None
+            self._set_connected(False)
+            self.show_error(message)
+        
+        # Start the session with credentials via stdin - they never touch the disk.
+        # The main loop collects the result, so no thread waits on the command.
+        self._connect_proc = self.run_command(
+            ["openvpn3", "session-start", "--config", config_path],
+            start_done,
+            input=f"{username}\n{password}\n",
+            on_error=start_failed
+        )
     
-    def show_credential_dialog(self, config_name, config_path, retry=False, stored_user=None, stored_pass=None):
-        """Show dialog to enter credentials"""
+    def get_credential_dialog(self):
+        """Build the credentials dialog on first use; later calls reuse it"""
+        if self._cred_dialog is not None:
+            return self._cred_dialog
+        
         dialog = Gtk.Dialog(
             title="Enter VPN Credentials",
             parent=self,
@@ -1310,14 +2036,8 @@ echo "✓ Keyring support packages installed"
         content_area.add(vbox)
         
         # Info label
-        if retry:
-            info_text = f"<b>Authentication failed. Please re-enter credentials for {config_name}</b>"
-        else:
-            info_text = f"<b>Enter credentials for {config_name}</b>"
-        
-        info_label = Gtk.Label()
-        info_label.set_markup(info_text)
-        vbox.pack_start(info_label, False, False, 0)
+        self._cred_info_label = Gtk.Label()
+        vbox.pack_start(self._cred_info_label, False, False, 0)
         
         # Username field
         username_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -1328,8 +2048,8 @@ echo "✓ Keyring support packages installed"
         username_label.set_xalign(0)
         username_box.pack_start(username_label, False, False, 0)
         
-        username_entry = Gtk.Entry()
-        username_box.pack_start(username_entry, True, True, 0)
+        self._cred_username_entry = Gtk.Entry()
+        username_box.pack_start(self._cred_username_entry, True, True, 0)
         
         # Password field
         password_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
@@ -1340,31 +2060,48 @@ echo "✓ Keyring support packages installed"
         password_label.set_xalign(0)
         password_box.pack_start(password_label, False, False, 0)
         
-        password_entry = Gtk.Entry()
-        password_entry.set_visibility(False)
-        password_entry.set_input_purpose(Gtk.InputPurpose.PASSWORD)
-        password_box.pack_start(password_entry, True, True, 0)
+        self._cred_password_entry = Gtk.Entry()
+        self._cred_password_entry.set_visibility(False)
+        self._cred_password_entry.set_input_purpose(Gtk.InputPurpose.PASSWORD)
+        password_box.pack_start(self._cred_password_entry, True, True, 0)
         
         # Remember checkbox
-        remember_check = Gtk.CheckButton(label="Remember credentials (stored securely)")
+        self._cred_remember_check = Gtk.CheckButton(label="Remember credentials (stored securely)")
+        vbox.pack_start(self._cred_remember_check, False, False, 0)
+        
+        # Security note
+        self._cred_security_label = Gtk.Label()
+        vbox.pack_start(self._cred_security_label, False, False, 0)
+        
+        self._cred_dialog = dialog
+        return dialog
+    
+    def show_credential_dialog(self, config_name, config_path, retry=False, stored_user=None, stored_pass=None):
+        """Show dialog to enter credentials"""
+        dialog = self.get_credential_dialog()
+        username_entry = self._cred_username_entry
+        password_entry = self._cred_password_entry
+        remember_check = self._cred_remember_check
+        
+        # Info label
+        if retry:
+            info_text = f"<b>Authentication failed. Please re-enter credentials for {config_name}</b>"
+        else:
+            info_text = f"<b>Enter credentials for {config_name}</b>"
+        self._cred_info_label.set_markup(info_text)
+        
         remember_check.set_active(True)
-        vbox.pack_start(remember_check, False, False, 0)
         
         # Security note
         if KEYRING_AVAILABLE and self.use_keyring:
             security_text = "Credentials will be stored in your system keyring"
         else:
             security_text = "Credentials will be stored in ~/.config/vpn3gui/credentials.json"
-        
-        security_label = Gtk.Label()
-        security_label.set_markup(f"<small><i>{security_text}</i></small>")
-        vbox.pack_start(security_label, False, False, 0)
+        self._cred_security_label.set_markup(f"<small><i>{security_text}</i></small>")
         
         # Pre-fill if we have stored credentials (passed as parameters now)
-        if stored_user and not retry:
-            username_entry.set_text(stored_user)
-        if stored_pass and not retry:
-            password_entry.set_text(stored_pass)
+        username_entry.set_text(stored_user if stored_user and not retry else "")
+        password_entry.set_text(stored_pass if stored_pass and not retry else "")
         
         dialog.show_all()
         
@@ -1375,14 +2112,15 @@ echo "✓ Keyring support packages installed"
             username_entry.grab_focus()
         
         response = dialog.run()
+        username = username_entry.get_text()
+        password = password_entry.get_text()
+        remember = remember_check.get_active()
+        
+        # Hide for reuse; don't keep the password in the hidden entry
+        dialog.hide()
+        password_entry.set_text("")
         
         if response == Gtk.ResponseType.OK:
-            username = username_entry.get_text()
-            password = password_entry.get_text()
-            remember = remember_check.get_active()
-            
-            dialog.destroy()
-            
             if username and password:
                 # Save credentials if requested
                 self.save_credentials(config_name, username, password, remember)
@@ -1391,14 +2129,13 @@ echo "✓ Keyring support packages installed"
                 self.start_vpn_with_credentials(config_path, username, password)
             else:
                 self.show_error("Username and password are required")
-                self.start_button.set_sensitive(True)  # Re-enable button
+                self._set_connected(False)  # Re-enable button
         else:
-            dialog.destroy()
-            self.start_button.set_sensitive(True)  # Re-enable button if cancelled
+            self._set_connected(False)  # Re-enable button if cancelled
     
     def update_vpn_password(self, widget=None):
         """Update password for selected VPN configuration"""
-        display_name = self.config_combo.get_active_text()
+        display_name = self.get_selected_config()
         if not display_name or display_name == "No configs available":
             self.show_error("Please select a VPN configuration first")
             return
@@ -1532,7 +2269,8 @@ echo "✓ Keyring support packages installed"
                 self.show_error("New password is required")
                 return
             
-            if new_password != confirm_password:
+            # Compare secrets in constant time so timing reveals nothing about them
+            if not hmac.compare_digest(new_password.encode(), confirm_password.encode()):
                 dialog.destroy()
                 self.show_error("Passwords do not match")
                 return
@@ -1547,103 +2285,85 @@ echo "✓ Keyring support packages installed"
     
     def show_question(self, message):
         """Show yes/no question dialog"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.QUESTION,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text=message
-        )
-        response = dialog.run()
-        dialog.destroy()
+        response = self.run_message_dialog(Gtk.MessageType.QUESTION, Gtk.ButtonsType.YES_NO, message)
         return response == Gtk.ResponseType.YES
     
     def get_plaintext_auth_file(self, config_path):
         """Get plaintext auth file path if it exists"""
         try:
-            result = subprocess.run(
-                ["openvpn3", "config-dump", "--config", config_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            config_content = self.dump_config(config_path)
             
-            if result.returncode == 0:
-                config_content = result.stdout
-                if "auth-user-pass" in config_content:
-                    lines = config_content.split('\n')
-                    for line in lines:
-                        if line.strip().startswith("auth-user-pass"):
-                            parts = line.strip().split()
-                            if len(parts) > 1:
-                                auth_file = os.path.expanduser(parts[1])
-                                if os.path.exists(auth_file):
-                                    return auth_file
+            if config_content is not None:
+                for match in AUTH_USER_PASS_RE.finditer(config_content):
+                    if match.group(1):
+                        auth_file = expand_home(match.group(1))
+                        if os.path.exists(auth_file):
+                            return auth_file
         except:
             pass
         return None
     
     def check_for_plaintext_auth(self):
         """Check all configs for plaintext auth files"""
-        self.plaintext_configs = []
+        configs = list(self.config_paths.items())
+        
+        def scan():
+            # One config-dump per config - keep it off the main loop, and run
+            # them side by side since each just waits on its child process
+            found = []
+            if configs:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(configs))) as pool:
+                    auth_files = pool.map(self.get_plaintext_auth_file, [path for _, path in configs])
+                    for (display_name, config_path), auth_file in zip(configs, auth_files):
+                        if auth_file:
+                            found.append((display_name, config_path, auth_file))
+            GLib.idle_add(self.plaintext_scan_done, found)
+        
+        self.run_in_background(scan)
+        return False  # Don't repeat this check
+    
+    def plaintext_scan_done(self, plaintext_configs):
+        """Act on the configs check_for_plaintext_auth found using plaintext auth files"""
+        self.plaintext_configs = plaintext_configs
         
-        for display_name, config_path in self.config_paths.items():
-            auth_file = self.get_plaintext_auth_file(config_path)
-            if auth_file:
-                self.plaintext_configs.append((display_name, config_path, auth_file))
+        # Build the bullet list once, not every time the migration dialog opens
+        summary = "\n".join(f"• {entry[0]}" for entry in plaintext_configs[:5])
+        if len(plaintext_configs) > 5:
+            summary += f"\n• ... and {len(plaintext_configs) - 5} more"
+        self._plaintext_summary = summary
         
         if self.plaintext_configs and not KEYRING_AVAILABLE:
             # Show warning about no keyring support
-            GLib.idle_add(self.show_keyring_recommendation)
+            self.show_keyring_recommendation()
         elif self.plaintext_configs:
             # Offer to migrate
-            GLib.idle_add(self.offer_credential_migration)
+            self.offer_credential_migration()
         
-        return False  # Don't repeat this check
+        return False
     
     def show_keyring_recommendation(self):
         """Show recommendation to install keyring"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.WARNING,
-            buttons=Gtk.ButtonsType.OK,
-            text="Security Warning: Plaintext Credentials Detected"
-        )
-        dialog.format_secondary_text(
+        self.run_message_dialog(
+            Gtk.MessageType.WARNING, Gtk.ButtonsType.OK,
+            "Security Warning: Plaintext Credentials Detected",
             "Your VPN configurations are using plaintext password files.\n\n"
             "For better security, install the Python keyring module:\n"
             "• Use Tools → Install Keyring Support\n"
             "• Or run: pip install keyring\n\n"
             "After installation, restart the application to migrate your credentials."
         )
-        dialog.run()
-        dialog.destroy()
     
     def offer_credential_migration(self):
         """Offer to migrate plaintext credentials to keyring"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.WARNING,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text="Migrate Plaintext Credentials?"
-        )
-        
-        config_list = "\n".join([f"• {name}" for name, _, _ in self.plaintext_configs[:5]])
-        if len(self.plaintext_configs) > 5:
-            config_list += f"\n• ... and {len(self.plaintext_configs) - 5} more"
-        
-        dialog.format_secondary_text(
+        response = self.run_message_dialog(
+            Gtk.MessageType.WARNING, Gtk.ButtonsType.YES_NO,
+            "Migrate Plaintext Credentials?",
             f"Found {len(self.plaintext_configs)} VPN configuration(s) using plaintext password files:\n\n"
-            f"{config_list}\n\n"
+            f"{self._plaintext_summary}\n\n"
             "Would you like to migrate these credentials to secure keyring storage?\n"
             "The plaintext files will be backed up but not deleted."
         )
         
-        response = dialog.run()
-        dialog.destroy()
-        
         if response == Gtk.ResponseType.YES:
             self.migrate_all_credentials()
     
@@ -1668,45 +2388,63 @@ echo "✓ Keyring support packages installed"
             self.show_info("No plaintext credential files found to migrate.")
             return
         
+        def read_auth_file(entry):
+            # Runs in a pool thread: read one auth file and back it up
+            display_name, config_path, auth_file = entry
+            try:
+                # Read the plaintext auth file (two short lines; don't read more)
+                with open(auth_file, 'r') as f:
+                    lines = f.read(4096).splitlines()
+                if len(lines) < 2:
+                    return display_name, None, None, "Invalid auth file format"
+                
+                # Create backup (owner-only from the start; an existing one is kept)
+                backup_file = auth_file + ".backup"
+                try:
+                    fd = os.open(backup_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_CLOEXEC, 0o600)
+                except FileExistsError:
+                    pass
+                else:
+                    with os.fdopen(fd, 'wb') as dst, open(auth_file, 'rb') as src:
+                        shutil.copyfileobj(src, dst)
+                return display_name, lines[0].strip(), lines[1].strip(), None
+            except Exception as e:
+                return display_name, None, None, str(e)
+        
+        # The file I/O runs side by side; credentials are stored on this thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(self.plaintext_configs))) as pool:
+            results = list(pool.map(read_auth_file, self.plaintext_configs))
+        
         migrated = 0
         failed = []
         
-        for display_name, config_path, auth_file in self.plaintext_configs:
+        for display_name, username, password, error in results:
+            if error is not None:
+                failed.append(f"{display_name}: {error}")
+                continue
+            # Save to keyring (written once after the loop)
+            self.save_credentials(display_name, username, password, remember=True, persist=False)
+            migrated += 1
+        
+        if migrated > 0:
             try:
-                # Read the plaintext auth file
-                with open(auth_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) >= 2:
-                        username = lines[0].strip()
-                        password = lines[1].strip()
-                        
-                        # Save to keyring
-                        self.save_credentials(display_name, username, password, remember=True)
-                        migrated += 1
-                        
-                        # Create backup
-                        backup_file = auth_file + ".backup"
-                        if not os.path.exists(backup_file):
-                            shutil.copy2(auth_file, backup_file)
-                            os.chmod(backup_file, 0o600)
-                    else:
-                        failed.append(f"{display_name}: Invalid auth file format")
+                self.persist_credentials()
             except Exception as e:
-                failed.append(f"{display_name}: {str(e)}")
+                failed.append(f"Saving credentials: {str(e)}")
+                migrated = 0
         
         # Show results
-        message = f"Migration Results:\n\n"
+        parts = ["Migration Results:\n\n"]
         if migrated > 0:
-            message += f"✓ Successfully migrated {migrated} credential(s) to secure storage\n\n"
+            parts.append(f"✓ Successfully migrated {migrated} credential(s) to secure storage\n\n")
         
         if failed:
-            message += "Failed to migrate:\n"
-            for fail in failed:
-                message += f"• {fail}\n"
-            message += "\n"
+            parts.append("Failed to migrate:\n")
+            parts.extend(f"• {fail}\n" for fail in failed)
+            parts.append("\n")
         
         if migrated > 0:
-            message += (
+            parts.append(
                 "Original plaintext files have been backed up with .backup extension.\n\n"
                 "You should now:\n"
                 "1. Update your .ovpn configs to remove auth-user-pass file references\n"
@@ -1714,7 +2452,7 @@ echo "✓ Keyring support packages installed"
                 "Your credentials are now securely stored in the system keyring!"
             )
         
-        self.show_info(message)
+        self.show_info("".join(parts))
     
     def show_keyring_install_dialog(self, widget=None):
         """Show keyring installation dialog"""
@@ -1767,40 +2505,7 @@ echo "✓ Keyring support packages installed"
         text_view.set_editable(False)
         text_view.set_wrap_mode(Gtk.WrapMode.WORD)
         scrolled.add(text_view)
-        
-        commands = """Installation Options for Linux Mint 22 / Ubuntu 24.04+:
-
-1. Using apt (RECOMMENDED - System Package Manager):
-   sudo apt update
-   sudo apt install python3-keyring python3-secretstorage gnome-keyring
-
-2. Using pipx (For User Installation - Isolated Environment):
-   # First install pipx if not already installed:
-   sudo apt install pipx
-   pipx ensurepath
-   
-   # Then install keyring:
-   pipx install keyring
-
-3. Using pip with --break-system-packages (NOT RECOMMENDED):
-   pip install --user --break-system-packages keyring
-   
-   ⚠️ Warning: This bypasses system protections and may cause issues
-
-4. Using a Virtual Environment (For Development):
-   python3 -m venv ~/vpn3gui-venv
-   source ~/vpn3gui-venv/bin/activate
-   pip install keyring
-   # Note: You'll need to run the GUI from this venv
-
-After installation, restart this application to enable secure credential storage.
-
-Note: Modern Linux distributions (Mint 22+, Ubuntu 23.04+, Debian 12+) use PEP 668
-to protect system Python packages. The apt method is preferred for system-wide use.
-"""
-        
-        buffer = text_view.get_buffer()
-        buffer.set_text(commands)
+        text_view.get_buffer().set_text(KEYRING_INSTALL_OPTIONS)
         
         dialog.show_all()
         response = dialog.run()
@@ -1815,8 +2520,7 @@ to protect system Python packages. The apt method is preferred for system-wide u
             self.run_keyring_installation("apt")
         elif response == Gtk.ResponseType.YES:
             # Copy to clipboard
-            clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-            clipboard.set_text("sudo apt install python3-keyring python3-secretstorage gnome-keyring", -1)
+            self._clipboard.set_text("sudo apt install python3-keyring python3-secretstorage gnome-keyring", -1)
             dialog.destroy()
             self.show_info("Command copied to clipboard!")
         else:
@@ -1824,135 +2528,43 @@ to protect system Python packages. The apt method is preferred for system-wide u
     
     def run_keyring_installation(self, method):
         """Run keyring installation"""
-        if method == "pipx":
-            commands = """#!/bin/bash
-echo "Installing Python keyring module via pipx..."
-echo ""
-echo "Step 1: Checking for pipx..."
-if ! command -v pipx &> /dev/null; then
-    echo "pipx not found. Installing pipx first..."
-    sudo apt update
-    sudo apt install -y pipx
-    if [ $? -ne 0 ]; then
-        echo "✗ Failed to install pipx"
-        echo "Press Enter to close..."
-        read
-        exit 1
-    fi
-    echo "✓ pipx installed"
-    echo ""
-    echo "Setting up pipx path..."
-    pipx ensurepath
-    export PATH="$PATH:$HOME/.local/bin"
-fi
-
-echo "Step 2: Installing keyring with pipx..."
-pipx install keyring
-if [ $? -eq 0 ]; then
-    echo ""
-    echo "✓ Keyring installed successfully via pipx!"
-    echo ""
-    echo "Note: You may need to log out and back in for PATH changes to take effect."
-    echo "Or run: source ~/.bashrc"
-    echo ""
-    echo "Please restart the VPN GUI to use secure credential storage."
-else
-    echo ""
-    echo "✗ Installation failed."
-    echo "You may want to try the apt method instead."
-fi
-echo ""
-echo "Press Enter to close..."
-read
-"""
-        else:  # apt (recommended)
-            commands = """#!/bin/bash
-echo "Installing Python keyring module via apt (Recommended)..."
-echo ""
-echo "This will install:"
-echo "  • python3-keyring - Python keyring library"
-echo "  • python3-secretstorage - Python Secret Service API"
-echo "  • gnome-keyring - GNOME keyring service"
-echo ""
-sudo apt update
-sudo apt install -y python3-keyring python3-secretstorage gnome-keyring
-if [ $? -eq 0 ]; then
-    echo ""
-    echo "✓ Keyring installed successfully!"
-    echo ""
-    echo "The system keyring service is now available for secure credential storage."
-    echo "Please restart the VPN GUI to enable this feature."
-else
-    echo ""
-    echo "✗ Installation failed."
-    echo "Please check your internet connection and try again."
-fi
-echo ""
-echo "Press Enter to close..."
-read
-"""
-        
-        # Save commands to temp script
-        script_path = "/tmp/install_keyring.sh"
-        with open(script_path, 'w') as f:
-            f.write(commands)
-        os.chmod(script_path, 0o755)
+        commands = KEYRING_INSTALL_SCRIPT_PIPX if method == "pipx" else KEYRING_INSTALL_SCRIPT_APT
         
-        # Get terminal command
-        terminal_cmd = self.get_terminal_command(script_path)
+        def launch():
+            # Starting the terminal stays off the GTK thread. The script is a
+            # couple of KB, so it goes on the command line, not in a file
+            terminal_cmd = self.terminal_command(["bash", "-c", commands])
+            try:
+                if terminal_cmd:
+                    subprocess.Popen(terminal_cmd)
+            except OSError as e:
+                GLib.idle_add(self.show_error, f"Could not start the installation: {e}")
+                return
+            GLib.idle_add(self.keyring_installation_started, terminal_cmd is not None)
         
-        if terminal_cmd:
-            # Run in terminal  
-            subprocess.Popen(terminal_cmd, shell=True)
-            
-            dialog = Gtk.MessageDialog(
-                transient_for=self,
-                flags=0,
-                message_type=Gtk.MessageType.INFO,
-                buttons=Gtk.ButtonsType.OK,
-                text="Installation Started"
-            )
-            dialog.format_secondary_text(
+        self.run_in_background(launch)
+    
+    def keyring_installation_started(self, started):
+        """Tell the user how launching the keyring install script went"""
+        if started:
+            self.run_message_dialog(
+                Gtk.MessageType.INFO, Gtk.ButtonsType.OK,
+                "Installation Started",
                 "The keyring installation has been started in a new terminal.\n\n"
                 "After installation completes, restart this application to enable\n"
                 "secure credential storage."
             )
-            dialog.run()
-            dialog.destroy()
         else:
             self.show_error("Could not determine terminal emulator. Please install manually.")
+        return False
     
     def show_simple_keyring_fix(self):
         """Show simple keyring fix for beginners"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text="Password Storage Setup Needed"
+        self.run_message_dialog(
+            Gtk.MessageType.INFO, Gtk.ButtonsType.OK,
+            "Password Storage Setup Needed",
+            SIMPLE_KEYRING_FIX_TEXT
         )
-        
-        secondary_text = """Your VPN passwords need a secure place to be stored.
-
-QUICK FIX - Takes 30 seconds:
-━━━━━━━━━━━━━━━━━━━━━━━━
-1. Click your Menu button (bottom left)
-2. Type: passwords
-3. Open "Passwords and Keys"
-4. Right-click on "Login"
-5. Choose "Unlock"
-6. Enter your computer password
-7. Close and restart this VPN app
-
-That's it! Your passwords will now be stored securely.
-
-If you need more help: Tools → Fix Password Storage Issues
-
-(For now, passwords will be saved locally until you complete this step)"""
-        
-        dialog.format_secondary_text(secondary_text)
-        dialog.run()
-        dialog.destroy()
     
     def toggle_debug_mode(self, widget):
         """Toggle debug mode on/off"""
@@ -1964,56 +2576,14 @@ If you need more help: Tools → Fix Password Storage Issues
     
     def show_keyring_initialization_help(self):
         """Show help for initializing the keyring"""
-        dialog = Gtk.MessageDialog(
-            transient_for=self,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text="Keyring Setup Help - Linux Mint 22.1"
+        self.run_message_dialog(
+            Gtk.MessageType.INFO, Gtk.ButtonsType.OK,
+            "Keyring Setup Help - Linux Mint 22.1",
+            KEYRING_INIT_HELP_TEXT
         )
-        
-        secondary_text = """Your keyring needs to be unlocked to store VPN passwords securely.
-
-SIMPLE FIX (Try this first):
-━━━━━━━━━━━━━━━━━━━━━━
-1. Click on your Menu button (bottom left corner)
-2. Type "passwords" in the search box
-3. Open "Passwords and Keys" app
-4. Look for a keyring called "Login" (you probably have this)
-5. If you see a locked padlock icon next to "Login":
-   • Right-click on "Login"
-   • Choose "Unlock"
-   • Enter YOUR COMPUTER LOGIN PASSWORD
-   • The padlock should now appear open
-
-If there's NO "Login" keyring:
-━━━━━━━━━━━━━━━━━━━━━━
-1. In "Passwords and Keys" app
-2. Click the "+" button (top left corner)
-3. Select "Password Keyring"
-4. Name it exactly: Login
-5. Password: Use YOUR COMPUTER LOGIN PASSWORD
-6. Confirm the password
-
-Still Having Issues?
-━━━━━━━━━━━━━━━━
-Try the automatic fix:
-1. Close this VPN app
-2. Open Terminal (Ctrl+Alt+T)
-3. Type: echo "" | gnome-keyring-daemon --unlock
-4. Press Enter (this unlocks with empty password)
-5. Restart the VPN app
-
-IMPORTANT: Your keyring password is the SAME password you use to log into Linux Mint.
-
-Note: Until fixed, your VPN passwords will be saved in a local file instead of the keyring."""
-        
-        dialog.format_secondary_text(secondary_text)
-        dialog.run()
-        dialog.destroy()
 
 if __name__ == "__main__":
     win = VPNManager()
-    win.connect("destroy", lambda w: (win.cleanup_temp_files(), Gtk.main_quit()))
+    win.connect("destroy", Gtk.main_quit)
     win.show_all()
     Gtk.main()
\ No newline at end of file